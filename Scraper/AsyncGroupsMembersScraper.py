@@ -0,0 +1,289 @@
+import asyncio
+import time
+from urllib.parse import urljoin
+from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from config.config import NAVIGATION_WAIT_UNTIL, PROFILE_EXTRACTION
+from Scraper.MembersList import *
+from Scraper.ProfileParser import PROFILE_FIELDS, EXTRACT_PROFILE_JS, parse_profile
+from Scraper.RateLimiter import TokenBucket
+from Scraper.Retry import *
+from Scraper.Waits import AsyncAdaptiveWaiter
+
+
+class AsyncGroupsMembersScraper:
+    """Async engine: one page walks the members list while a bounded pool of pages enriches profiles.
+
+    Settings, the resource blocker and latency stats are borrowed from the GroupsMembersScraper
+    it is created for. Login itself stays on the sync engine (CaptchaSolver is sync-only),
+    this engine starts from the session it saved.
+    """
+
+    def __init__(self, scraper, concurrency: int = 3, rate: float = 0.5, burst: int = 1):
+        self.scraper = scraper
+        self.concurrency = max(1, concurrency)
+        self.limiter = TokenBucket(rate, burst)
+        self.waiter = AsyncAdaptiveWaiter(scraper.waiter.timeout_ms, scraper.waiter.min_delay_ms, scraper.waiter.stats)
+        self.playwright = None
+        self.browser = None
+        self.session_expired = False
+        # URLs written or given up on, so a run restarted after logging in again can skip them
+        self.completed = set()
+
+    async def start(self):
+        start = time.perf_counter()
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(headless=self.scraper.headless)
+        self.context = await self.browser.new_context(storage_state=self.scraper.storage_state_file)
+        await self.scraper.blocker.install_async(self.context)
+        self.page = await self.context.new_page()
+        self.page.on("dialog", lambda dialog: dialog.dismiss())
+        elapsed = time.perf_counter() - start
+        self.scraper.metrics.observe('start_browser', elapsed * 1000, headless=self.scraper.headless, engine='async')
+        print(f"Async browser started in {elapsed:.1f}s (headless={self.scraper.headless}, pages={self.concurrency})")
+
+    async def stop(self):
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def goto(self, page, url: str):
+        await self.limiter.acquire()
+        await page.goto(url, wait_until=NAVIGATION_WAIT_UNTIL)
+
+    async def has_session(self) -> bool:
+        await self.goto(self.page, urljoin(self.scraper.base_url, "feed/"))
+        return not any(marker in self.page.url for marker in AUTH_URL_MARKERS)
+
+    async def open_members_list(self, group_url, search=None):
+        with self.scraper.metrics.span('open_members_list', group_url=group_url, search=search):
+            await self.navigate_to_members_list(group_url, search)
+
+    async def navigate_to_members_list(self, group_url, search=None):
+        await self.goto(self.page, group_url)
+        check_session(self.page.url)
+        await self.waiter.wait_for_selector(self.page, 'group_page', f'main h1, {JOIN_BUTTON_SELECTOR}')
+
+        join_button = await self.page.query_selector(JOIN_BUTTON_SELECTOR)
+        if join_button:
+            await join_button.click()
+            if await self.waiter.wait_for_selector(self.page, 'join_dialog', CONTINUE_BUTTON_SELECTOR, timeout_ms=2000):
+                await self.page.click(CONTINUE_BUTTON_SELECTOR)
+            await self.page.wait_for_load_state('networkidle')
+
+        await self.goto(self.page, urljoin(group_url, "members/"))
+        await self.waiter.wait_for_selector(self.page, 'members_page', MEMBERS_LIST_SELECTOR)
+
+        if search:
+            await self.page.evaluate(MARK_MEMBERS_STALE_JS, MEMBERS_LIST_SELECTOR)
+            await self.page.fill(SEARCH_INPUT_SELECTOR, search)
+            await self.limiter.acquire()
+            await self.page.keyboard.press("Enter")
+            await self.waiter.wait_for_function(self.page, 'search', MEMBERS_REFRESHED_JS, MEMBERS_LIST_SELECTOR)
+
+    async def harvest_members_hrefs(self):
+        hrefs = await self.page.evaluate(HARVEST_MEMBERS_HREFS_JS, [MEMBERS_LIST_SELECTOR, MEMBER_LINK_SELECTOR])
+        if hrefs is None:
+            check_session(self.page.url)
+            raise LayoutChanged("Members list not found on page")
+        return hrefs
+
+    async def scroll_to_load_all_members(self):
+        prev_height = 0
+
+        while True:
+            hrefs = await self.harvest_members_hrefs()
+            if hrefs:
+                yield hrefs
+
+            step_start = time.perf_counter()
+            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
+            await self.waiter.pause(self.page, 'scroll')
+
+            show_more_btn = await self.page.query_selector(SHOW_MORE_SELECTOR)
+            if show_more_btn:
+                try:
+                    count = await self.page.evaluate(COUNT_MEMBERS_JS, MEMBERS_LIST_SELECTOR)
+                    await self.limiter.acquire()
+                    await show_more_btn.click()
+                    await self.waiter.wait_for_function(self.page, 'show_more', MEMBERS_GREW_JS, [MEMBERS_LIST_SELECTOR, count])
+                    self.scraper.metrics.count('show_more_clicks')
+                    print("Clicked 'Show more results' button")
+                except Exception:
+                    pass
+
+            new_height = await self.page.evaluate("document.body.scrollHeight")
+            self.scraper.metrics.observe('scroll_to_load_all_members', (time.perf_counter() - step_start) * 1000)
+            if new_height == prev_height and not show_more_btn:
+                break
+            prev_height = new_height
+
+        hrefs = await self.harvest_members_hrefs()
+        if hrefs:
+            yield hrefs
+
+    async def iter_members_urls(self, group_url, search=None, seen=None):
+        await self.open_members_list(group_url, search)
+        seen = set() if seen is None else seen
+        async for hrefs in self.scroll_to_load_all_members():
+            batch = self.scraper.dedup_hrefs(hrefs, seen)
+            if batch:
+                yield batch
+
+    async def get_member_info(self, page, member_url):
+        cache = self.scraper.cache
+        metrics = self.scraper.metrics
+        cached = cache.get(member_url) if cache else None
+        if cached:
+            metrics.count('profile_cache_hits')
+            return cached
+        with metrics.span('fetch_profile', url=member_url):
+            await self.goto(page, member_url)
+            check_session(page.url)
+            if not await self.waiter.wait_for_selector(page, 'profile', 'main h1'):
+                check_session(page.url)
+                raise PlaywrightTimeoutError(f"Profile did not load within {self.waiter.timeout_ms}ms")
+            start = time.perf_counter()
+            if PROFILE_EXTRACTION == "lxml":
+                member = parse_profile(await page.content(), member_url)
+            else:
+                member = await page.evaluate(EXTRACT_PROFILE_JS, PROFILE_FIELDS)
+            self.waiter.stats.record('extract', (time.perf_counter() - start) * 1000)
+            if not member.get('name'):
+                raise LayoutChanged("Profile name not found, the selectors may be out of date")
+        member['profile_url'] = member_url
+        metrics.count('profiles_fetched')
+        if cache:
+            cache.put(member)
+        return member
+
+    async def get_member_info_with_retry(self, page, member_url):
+        """Same policy as the sync engine, except an expired session stops the run so the sync side can log in"""
+        retry = self.scraper.retry
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self.get_member_info(page, member_url)
+            except Exception as e:
+                category, delay = retry.decide(e, attempt)
+                if category == SESSION_EXPIRED:
+                    self.session_expired = True
+                    return None
+                if delay is None:
+                    print(f"Error fetching member info from {member_url} ({category}): {e}")
+                    self.scraper.dead_letter(member_url, category, e, attempt)
+                    return None
+                print(f"Retrying {member_url} in {delay:.1f}s after {category}")
+                await asyncio.sleep(delay)
+
+    async def enrich_worker(self, queue: asyncio.Queue, writer):
+        page = await self.context.new_page()
+        try:
+            while True:
+                member_url = await queue.get()
+                if member_url is None:
+                    return
+                # Keep draining after the session expired so the producer is never blocked on a full queue
+                if self.session_expired:
+                    continue
+                member = await self.get_member_info_with_retry(page, member_url)
+                if member:
+                    if self.scraper.normalizer:
+                        self.scraper.normalizer.normalize([member])
+                    writer.write(member)
+                    self.completed.add(member_url)
+                elif not self.session_expired:
+                    self.completed.add(member_url)
+        finally:
+            await page.close()
+
+    async def enrich(self, produce, writer):
+        """Run the worker pool while produce(queue) feeds it profile URLs"""
+        # Bounded so discovery never runs far ahead of enrichment
+        queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        workers = [asyncio.create_task(self.enrich_worker(queue, writer)) for _ in range(self.concurrency)]
+
+        async def feed():
+            await produce(queue)
+            for _ in workers:
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(feed()), *workers]
+        try:
+            # A dead worker stops reading the queue, so the first failure must cancel the producer
+            # instead of leaving it blocked on a full queue
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def write_members(self, members_urls, writer):
+        async def produce(queue):
+            for member_url in members_urls:
+                if self.session_expired:
+                    return
+                await queue.put(member_url)
+
+        await self.enrich(produce, writer)
+
+    async def discover_and_enrich(self, group_url, search, writer, state, run_key):
+        retry = self.scraper.retry
+
+        async def produce(queue):
+            discovered = 0
+            seen = set()
+            attempt = 0
+            start = time.perf_counter()
+            # Time blocked on a full queue is enrichment time, get_members_urls only measures the members list
+            blocked = 0.0
+            while True:
+                attempt += 1
+                try:
+                    async for batch in self.iter_members_urls(group_url, search, seen):
+                        discovered += len(batch)
+                        put_start = time.perf_counter()
+                        for member_url in self.scraper.queue_batch(batch, state, run_key):
+                            await queue.put(member_url)
+                        blocked += time.perf_counter() - put_start
+                        if self.session_expired:
+                            return
+                    state.mark_discovery_done(run_key)
+                    self.scraper.metrics.observe('get_members_urls', (time.perf_counter() - start - blocked) * 1000, members=discovered)
+                    print(f"Scraped {discovered} members urls")
+                    return
+                except Exception as e:
+                    category, delay = retry.decide(e, attempt)
+                    if category == SESSION_EXPIRED:
+                        self.session_expired = True
+                        return
+                    if delay is None:
+                        self.scraper.metrics.observe('get_members_urls', (time.perf_counter() - start - blocked) * 1000, error=e, members=discovered)
+                        print(f"Error scraping members ({category}): {e}")
+                        return
+                    print(f"Retrying members list in {delay:.1f}s after {category}")
+                    await asyncio.sleep(delay)
+
+        await self.enrich(produce, writer)
+
+    async def run(self, group_url, search, writer, state, run_key, pending_urls=None) -> bool:
+        """Enrich pending_urls, or discover and enrich the group; False when the saved session is no longer valid
+        or expired during the run"""
+        await self.start()
+        try:
+            if not await self.has_session():
+                return False
+            if pending_urls is not None:
+                await self.write_members(pending_urls, writer)
+            else:
+                await self.discover_and_enrich(group_url, search, writer, state, run_key)
+            return not self.session_expired
+        finally:
+            await self.stop()
@@ -0,0 +1,109 @@
+import csv
+import json
+import os
+from typing import Dict, Iterator, List
+from config.config import OUTPUT_FORMATS, SINK_BATCH_SIZE, SINK_FSYNC
+from Scraper.Retry import SessionExpired
+from Scraper.Writers import open_writers
+from utils.urls import canonical_profile_url
+
+
+def load_jobs(path: str) -> List[Dict]:
+    """Read (group_url, search, output) jobs from a JSON Lines or YAML file"""
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML job files need PyYAML, install it with `pip install pyyaml` or use JSON Lines")
+            jobs = yaml.safe_load(f) or []
+        else:
+            jobs = [json.loads(line) for line in f if line.strip()]
+
+    for i, job in enumerate(jobs, 1):
+        missing = [key for key in ('group_url', 'output') if not job.get(key)]
+        if missing:
+            raise ValueError(f"Job {i} in {path} is missing {', '.join(missing)}")
+    return jobs
+
+
+def read_members(output_members_file: str) -> Iterator[Dict]:
+    """Read back the members a job wrote, from whichever output format is available"""
+    base, _ = os.path.splitext(output_members_file)
+    if os.path.exists(f"{base}.jsonl"):
+        with open(f"{base}.jsonl", encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif os.path.exists(f"{base}.csv"):
+        with open(f"{base}.csv", newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+    elif os.path.exists(f"{base}.json"):
+        with open(f"{base}.json", encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def output_mtimes(output_members_file: str) -> Dict[str, int]:
+    """Modification time of each output file of a job, to tell whether a run wrote to it"""
+    base, _ = os.path.splitext(output_members_file)
+    paths = [f"{base}.{fmt}" for fmt in ('jsonl', 'csv', 'json')]
+    return {path: os.stat(path).st_mtime_ns for path in paths if os.path.exists(path)}
+
+
+class BatchRunner:
+    """Runs many group/search jobs on one browser and one logged-in context"""
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+
+    def run(self, jobs: List[Dict], combined_output: str):
+        failed = []
+        # Jobs whose output this batch wrote: every successful one, and failed ones that saved part of their members.
+        # A job that failed before writing anything may still have an output file left by an earlier batch.
+        written = []
+        self.scraper.open_stores()
+        try:
+            for i, job in enumerate(jobs, 1):
+                base, _ = os.path.splitext(job['output'])
+                print(f"Job {i}/{len(jobs)}: {job['group_url']} search={job.get('search')!r}")
+                before = output_mtimes(job['output'])
+                try:
+                    self.scraper.scrape_group(
+                        job['group_url'],
+                        job.get('urls_output', f"{base}_urls.json"),
+                        job['output'],
+                        job.get('search'),
+                        job.get('resume', False),
+                    )
+                    written.append(job)
+                except SessionExpired as e:
+                    # Logging in again was already tried, every remaining job would only hit the authwall
+                    print(f"Job {i} stopped, the session expired again ({e}); jobs {i}-{len(jobs)} were not finished")
+                    failed.extend(range(i, len(jobs) + 1))
+                    if output_mtimes(job['output']) != before:
+                        written.append(job)
+                    break
+                except Exception as e:
+                    # One broken group must not take the rest of the batch down
+                    print(f"Job {i} failed: {e}")
+                    failed.append(i)
+                    if output_mtimes(job['output']) != before:
+                        written.append(job)
+        finally:
+            self.scraper.stop_browser()
+            self.scraper.close_stores()
+
+        self.write_combined(written, combined_output)
+        print(f"Batch finished: {len(jobs) - len(failed)} of {len(jobs)} jobs succeeded" + (f", failed jobs: {failed}" if failed else ""))
+        return failed
+
+    def write_combined(self, jobs: List[Dict], combined_output: str):
+        seen = set()
+        with open_writers(combined_output, OUTPUT_FORMATS, batch_size=SINK_BATCH_SIZE, fsync=SINK_FSYNC) as writer:
+            for job in jobs:
+                for member in read_members(job['output']):
+                    key = canonical_profile_url(member['profile_url'])
+                    if key not in seen:
+                        seen.add(key)
+                        writer.write(member)
+        print(f"Saved {writer.count} unique members to {', '.join(w.filename for w in writer.writers)}")
@@ -2,11 +2,6 @@ import time
 import random
 from playwright.sync_api import Page
 from typing import Optional, List, Tuple
-import cv2
-import numpy as np
-from PIL import Image
-import io
-import base64
 
 
 class CaptchaSolver:
@@ -1,40 +1,113 @@
-import csv,random,json
+import asyncio,csv,json,os,time
 from urllib.parse import urljoin
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from utils.headers import headers
-from Scraper.CaptchaSolver import *
+from utils.urls import canonical_profile_url
+from config.config import (
+    OUTPUT_FORMATS, SINK_BATCH_SIZE, SINK_FSYNC, RUN_STATE_FILE, MEMBERS_EXTRACTION, PROFILE_EXTRACTION, STREAM_ENRICHMENT,
+    WAIT_TIMEOUT_MS, WAIT_MIN_DELAY_MS, BLOCKED_RESOURCE_TYPES, BLOCKED_URL_PATTERNS, NAVIGATION_WAIT_UNTIL,
+    HEADLESS, STORAGE_STATE_FILE, ENGINE, CONCURRENCY, MAX_REQUESTS_PER_SECOND, RATE_BURST,
+    PROFILE_CACHE_FILE, PROFILE_CACHE_TTL_SECONDS, PROFILE_CACHE_MAX_ENTRIES,
+    MEMBERS_DB_FILE, METRICS_TRACE_FILE, METRICS_PORT, BASE_URL,
+    RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_BUDGET, DEAD_LETTER_FILE,
+    NORMALIZE_LOCATIONS, LOCATION_CACHE_SIZE,
+)
+from Scraper.Writers import open_writers
+from Scraper.RunState import RunState
+from Scraper.MembersList import *
+from Scraper.Waits import AdaptiveWaiter
+from Scraper.ResourceBlocker import ResourceBlocker
+from Scraper.RateLimiter import TokenBucket
+from Scraper.ProfileParser import PROFILE_FIELDS, EXTRACT_PROFILE_JS, parse_profile
+from Scraper.AsyncGroupsMembersScraper import AsyncGroupsMembersScraper
+from Scraper.ProfileCache import ProfileCache
+from Scraper.MemberStore import MemberStore, StoreWriter
+from Scraper.Metrics import Metrics
+from Scraper.Retry import *
+from Scraper.LocationNormalizer import LocationNormalizer
 
 
 
 class GroupsMembersScraper:
-    def __init__(self,email, password):
+    def __init__(self,email, password, headless=HEADLESS, storage_state_file=STORAGE_STATE_FILE, engine=ENGINE, concurrency=CONCURRENCY, base_url=BASE_URL):
+        if engine not in ("sync", "async"):
+            raise ValueError(f"Unknown engine {engine!r}, expected 'sync' or 'async'")
         self.email = email
         self.password = password
-        self.base_url = "https://www.linkedin.com/"
+        self.headless = headless
+        self.storage_state_file = storage_state_file
+        self.engine = engine
+        self.concurrency = concurrency
+        self.base_url = base_url if base_url.endswith('/') else base_url + '/'
         self.login_url = urljoin(self.base_url, "login")
         self.browser = None
         self.page = None
+        self.waiter = AdaptiveWaiter(timeout_ms=WAIT_TIMEOUT_MS, min_delay_ms=WAIT_MIN_DELAY_MS)
+        # One set of latency samples: waits per step and timed phases land in the same summary
+        self.metrics = Metrics(METRICS_TRACE_FILE, METRICS_PORT, stats=self.waiter.stats)
+        self.blocker = ResourceBlocker(BLOCKED_RESOURCE_TYPES, BLOCKED_URL_PATTERNS, metrics=self.metrics)
+        # Same ceiling as the async engine, so both can be compared at one request rate
+        self.limiter = TokenBucket(MAX_REQUESTS_PER_SECOND, RATE_BURST)
+        self.state = None
+        self.cache = None
+        self.store = None
+        self.duplicates_skipped = 0
+        self.already_enriched = 0
+        self.retry = RetryPolicy(RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, RETRY_BUDGET)
+        self.dead_letters = DeadLetters(DEAD_LETTER_FILE)
+        self.session_renewals = 0
+        self.run_key = None
+        # Dead-lettered URL -> the run that discovered it, while replay_dead_letters() retries them
+        self.replay_run_keys = {}
+        self.normalizer = LocationNormalizer(LOCATION_CACHE_SIZE) if NORMALIZE_LOCATIONS else None
 
     def startBrowser(self):
+        start = time.perf_counter()
         self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(headless=False)
-        self.context = self.browser.new_context()
+        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        storage_state = self.storage_state_file if self.storage_state_file and os.path.exists(self.storage_state_file) else None
+        self.context = self.browser.new_context(storage_state=storage_state)
+        self.blocker.install(self.context)
         self.page = self.context.new_page()
         self.page.on("dialog", lambda dialog: dialog.dismiss())
+        elapsed = time.perf_counter() - start
+        self.metrics.observe('start_browser', elapsed * 1000, headless=self.headless)
+        print(f"Browser started in {elapsed:.1f}s (headless={self.headless})")
 
 
 
     def stop_browser(self):
         if self.browser:
             self.browser.close()
+            self.browser = None
         if hasattr(self, "playwright"):
             self.playwright.stop()
+            del self.playwright
     
 
     
+    def has_session(self):
+        """Cheap check of the saved session: auth cookie first, then one lightweight navigation"""
+        now = time.time()
+        if not any(cookie['name'] == 'li_at' and (cookie['expires'] < 0 or cookie['expires'] > now) for cookie in self.context.cookies(self.base_url)):
+            return False
+        self.goto(self.page, urljoin(self.base_url, "feed/"))
+        return not any(marker in self.page.url for marker in AUTH_URL_MARKERS)
+
+
+
     def login(self):
+        start = time.perf_counter()
+        if self.has_session():
+            elapsed = time.perf_counter() - start
+            self.metrics.observe('login', elapsed * 1000, reused_session=True)
+            print(f"Reused saved session in {elapsed:.1f}s")
+            return
+
+        # Captcha challenges need their images, so nothing is blocked until login is over
+        self.blocker.enabled = False
         try:
             self.page.goto(self.login_url)
             self.page.fill('input[name="session_key"]', self.email)
@@ -42,6 +115,8 @@ class GroupsMembersScraper:
             self.page.click('button[type="submit"]')
             self.page.wait_for_load_state('networkidle')
             
+            # Imported here so runs that reuse a saved session never load it
+            from Scraper.CaptchaSolver import CaptchaSolver
             captcha_solver = CaptchaSolver(self.page)
             if captcha_solver.detect_captcha():
                 print("Captcha detected after login attempt!")
@@ -55,70 +130,156 @@ class GroupsMembersScraper:
                     else:
                         raise Exception("Captcha solving failed - manual intervention required")
 
-            self.page.wait_for_timeout(2000)
+            self.waiter.pause(self.page, 'login_delay')
+            if self.storage_state_file and any(cookie['name'] == 'li_at' for cookie in self.context.cookies(self.base_url)):
+                self.context.storage_state(path=self.storage_state_file)
+            elapsed = time.perf_counter() - start
+            self.metrics.observe('login', elapsed * 1000, reused_session=False)
+            print(f"Logged in in {elapsed:.1f}s")
         except Exception as e:
+            self.metrics.observe('login', (time.perf_counter() - start) * 1000, error=e, reused_session=False)
             print(f"Login failed: {e}")
+        finally:
+            self.blocker.enabled = True
 
 
 
     def scroll_to_load_all_members(self):
+        """Scroll the members list, yielding the hrefs of entries appended after each step"""
         prev_height = 0
 
         while True:
+            hrefs = self.harvest_members_hrefs()
+            if hrefs:
+                yield hrefs
+
+            step_start = time.perf_counter()
             self.page.evaluate("window.scrollTo(0, document.body.scrollHeight);")
-            self.page.wait_for_timeout(random.uniform(0.2, 0.5) * 1000)
+            self.waiter.pause(self.page, 'scroll')
 
-            show_more_btn = self.page.query_selector('button:has-text("Show more results"), button:has-text("Afficher plus de résultats")')
+            show_more_btn = self.page.query_selector(SHOW_MORE_SELECTOR)
             if show_more_btn:
                 try:
+                    count = self.page.evaluate(COUNT_MEMBERS_JS, MEMBERS_LIST_SELECTOR)
+                    self.limiter.wait()
                     show_more_btn.click()
-                    self.page.wait_for_timeout(random.uniform(1.5, 3.0) * 1000)
+                    self.waiter.wait_for_function(self.page, 'show_more', MEMBERS_GREW_JS, [MEMBERS_LIST_SELECTOR, count])
+                    self.metrics.count('show_more_clicks')
                     print("Clicked 'Show more results' button")
                 except:
                     pass
 
             new_height = self.page.evaluate("document.body.scrollHeight")
+            self.metrics.observe('scroll_to_load_all_members', (time.perf_counter() - step_start) * 1000)
             if new_height == prev_height and not show_more_btn:
                 break
             prev_height = new_height
 
-        
+        hrefs = self.harvest_members_hrefs()
+        if hrefs:
+            yield hrefs
+
+
+
+    def harvest_members_hrefs(self):
+        if MEMBERS_EXTRACTION == "lxml":
+            return []
+        hrefs = self.page.evaluate(HARVEST_MEMBERS_HREFS_JS, [MEMBERS_LIST_SELECTOR, MEMBER_LINK_SELECTOR])
+        if hrefs is None:
+            check_session(self.page.url)
+            raise LayoutChanged("Members list not found on page")
+        return hrefs
+
+
+
+    def open_members_list(self, group_url, search=None):
+        with self.metrics.span('open_members_list', group_url=group_url, search=search):
+            self.navigate_to_members_list(group_url, search)
+
+
+
+    def goto(self, page, url):
+        self.limiter.wait()
+        page.goto(url, wait_until=NAVIGATION_WAIT_UNTIL)
+
+
+
+    def navigate_to_members_list(self, group_url, search=None):
+        self.goto(self.page, group_url)
+        check_session(self.page.url)
+        self.waiter.wait_for_selector(self.page, 'group_page', f'main h1, {JOIN_BUTTON_SELECTOR}')
+
+        join_button = self.page.query_selector(JOIN_BUTTON_SELECTOR)
+        if join_button:
+            join_button.click()
+            if self.waiter.wait_for_selector(self.page, 'join_dialog', CONTINUE_BUTTON_SELECTOR, timeout_ms=2000):
+                self.page.click(CONTINUE_BUTTON_SELECTOR)
+            self.page.wait_for_load_state('networkidle')
+
+        self.goto(self.page, urljoin(group_url, "members/"))
+        self.waiter.wait_for_selector(self.page, 'members_page', MEMBERS_LIST_SELECTOR)
+
+        if search:
+            self.page.evaluate(MARK_MEMBERS_STALE_JS, MEMBERS_LIST_SELECTOR)
+            self.page.fill(SEARCH_INPUT_SELECTOR, search)
+            self.limiter.wait()
+            self.page.keyboard.press("Enter")
+            self.waiter.wait_for_function(self.page, 'search', MEMBERS_REFRESHED_JS, MEMBERS_LIST_SELECTOR)
+
+
+
+    def iter_members_urls(self, group_url, search=None, seen=None):
+        """Yield batches of newly discovered profile URLs while the members list is still loading.
+
+        Pass the same seen set again when retrying so the URLs already yielded are skipped.
+        """
+        self.open_members_list(group_url, search)
+        batches = self.scroll_to_load_all_members()
+        if MEMBERS_EXTRACTION == "lxml":
+            for _ in batches:
+                pass
+            members_urls = parse_members_html(self.page.content(), self.base_url)
+            if members_urls is None:
+                raise LayoutChanged("Members list not found on page")
+            batches = [members_urls]
+
+        seen = set() if seen is None else seen
+        for hrefs in batches:
+            batch = self.dedup_hrefs(hrefs, seen)
+            if batch:
+                yield batch
+
+
+
+    def dedup_hrefs(self, hrefs, seen):
+        """Canonicalize member hrefs and drop the ones already seen in this run"""
+        batch = []
+        for href in hrefs:
+            profile_url = canonical_profile_url(urljoin(self.base_url, href))
+            if profile_url in seen:
+                self.duplicates_skipped += 1
+            else:
+                seen.add(profile_url)
+                batch.append(profile_url)
+        return batch
+
+
+
+    def queue_batch(self, batch, state, run_key):
+        """Journal a discovered batch and return the URLs that still need enriching"""
+        pending_urls = state.add_discovered(run_key, batch)
+        self.already_enriched += len(batch) - len(pending_urls)
+        return pending_urls
+
+
 
     def get_members_urls(self, group_url,search=None) :
-        self.page.goto(group_url)
         members_urls = []
 
         try:
-            self.page.wait_for_timeout(2000)
-            content = self.page.content()
-
-            join_button = self.page.query_selector('button:has(span.a11y-text:has-text("Rejoindre le groupe"))')
-            if join_button:
-                join_button.click()
-                self.page.wait_for_timeout(1000)
-                continue_button = self.page.query_selector('button:has-text("Continue"), button:has-text("Continuer")')
-                if continue_button:
-                    continue_button.click()
-
-            self.page.wait_for_timeout(2000)
-            self.page.goto(urljoin(group_url, "members/"))
-            self.page.wait_for_timeout(2000)
-            
-            if search:
-                self.page.fill('input[placeholder="Search members"], input[placeholder="Chercher des membres"]', search)
-                self.page.keyboard.press("Enter")
-                self.page.wait_for_timeout(2000)
-
-            self.scroll_to_load_all_members()
-            content = self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            member_elements = soup.select_one('ul.artdeco-list.groups-members-list__results-list')
-
-            for member in member_elements.find_all('li'):
-                profile_url_elem = member.find('a',class_='ember-view ui-conditional-link-wrapper ui-entity-action-row__link')
-                profile_url = urljoin(self.base_url, profile_url_elem['href']) if profile_url_elem else None
-                if profile_url:
-                    members_urls.append(profile_url)
+            with self.metrics.span('get_members_urls', group_url=group_url, search=search):
+                for batch in self.iter_members_urls(group_url, search):
+                    members_urls.extend(batch)
 
             print(f"Scraped {len(members_urls)} members urls")
 
@@ -129,26 +290,81 @@ class GroupsMembersScraper:
         
 
 
-    def get_members_infos(self,members_urls):
-        members = []
-
+    def get_members_infos(self,members_urls,page=None):
+        page = page or self.page
         for member_url in members_urls:
+            cached = self.cache.get(member_url) if self.cache else None
+            if cached:
+                self.metrics.count('profile_cache_hits')
+                yield cached
+                continue
+            member = self.fetch_member_with_retry(page, member_url)
+            if member:
+                yield member
+
+
+
+    def fetch_member(self, page, member_url):
+        with self.metrics.span('fetch_profile', url=member_url):
+            self.goto(page, member_url)
+            check_session(page.url)
+            if not self.waiter.wait_for_selector(page, 'profile', 'main h1'):
+                check_session(page.url)
+                raise PlaywrightTimeoutError(f"Profile did not load within {self.waiter.timeout_ms}ms")
+            start = time.perf_counter()
+            if PROFILE_EXTRACTION == "lxml":
+                member = parse_profile(page.content(), member_url)
+            else:
+                member = page.evaluate(EXTRACT_PROFILE_JS, PROFILE_FIELDS)
+            self.waiter.stats.record('extract', (time.perf_counter() - start) * 1000)
+            if not member.get('name'):
+                raise LayoutChanged("Profile name not found, the selectors may be out of date")
+        member['profile_url'] = member_url
+        self.metrics.count('profiles_fetched')
+        if self.cache:
+            self.cache.put(member)
+        return member
+
+
+
+    def fetch_member_with_retry(self, page, member_url):
+        """Fetch one profile, retrying transient failures; permanent ones go to the dead-letter file"""
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                self.page.goto(member_url)
-                self.page.wait_for_timeout(2000)
-                name = self.page.query_selector('h1.CoYQrHnsjyAPOaMMSxtfPHyUhTgTKmYomTM.inline.t-24.v-align-middle.break-words').inner_text().strip() if self.page.query_selector('h1.CoYQrHnsjyAPOaMMSxtfPHyUhTgTKmYomTM.inline.t-24.v-align-middle.break-words') else None
-                headline = self.page.query_selector('div.text-body-medium.break-words').inner_text().strip() if self.page.query_selector('div.text-body-medium.break-words') else None
-                country = self.page.query_selector('span.text-body-small.inline.t-black--light.break-words').inner_text().strip() if self.page.query_selector('span.text-body-small.inline.t-black--light.break-words') else None
-                members.append({
-                    'name': name,
-                    'headline': headline,
-                    'country': country,
-                    'profile_url': member_url
-                })
+                return self.fetch_member(page, member_url)
             except Exception as e:
-                print(f"Error fetching member info from {member_url}: {e}")
-                continue
-        return members
+                category, delay = self.retry.decide(e, attempt)
+                if category == SESSION_EXPIRED:
+                    if self.renew_session():
+                        continue
+                    # Every later profile would land on the authwall too: stop the run, the URLs stay pending
+                    raise
+                if delay is None:
+                    print(f"Error fetching member info from {member_url} ({category}): {e}")
+                    self.dead_letter(member_url, category, e, attempt)
+                    return None
+                print(f"Retrying {member_url} in {delay:.1f}s after {category}")
+                page.wait_for_timeout(delay * 1000)
+
+
+
+    def dead_letter(self, member_url, category, error, attempts):
+        """Give up on a profile, filed under its original run when it fails again during a replay"""
+        run_key = self.replay_run_keys.get(member_url, self.run_key)
+        self.dead_letters.add(member_url, category, error, attempts, run_key)
+
+
+
+    def renew_session(self):
+        """Log in again, at most once per session, when LinkedIn drops the login mid-run"""
+        if self.session_renewals >= 1:
+            return False
+        self.session_renewals += 1
+        print("Session expired, logging in again")
+        self.login()
+        return True
  
 
 
@@ -167,22 +383,259 @@ class GroupsMembersScraper:
 
 
     def save_to_json(self, members, filename: str):
-        with open(filename, 'w', encoding='utf-8') as output_file:
-            json.dump(members, output_file, ensure_ascii=False, indent=4)
-            print(f"Saved data to {filename}")
+        with self.metrics.span('save_to_json', filename=filename, records=len(members)):
+            with open(filename, 'w', encoding='utf-8') as output_file:
+                json.dump(members, output_file, ensure_ascii=False, indent=4)
+        print(f"Saved data to {filename}")
     
 
 
-    def run(self, group_url, output_urls_file,output_members_file,search=None):
-        try:
+    def open_stores(self):
+        """Open the run-state journal, profile cache and member store shared by every job of a session"""
+        self.state = RunState(RUN_STATE_FILE)
+        if PROFILE_CACHE_FILE:
+            self.cache = ProfileCache(PROFILE_CACHE_FILE, PROFILE_CACHE_TTL_SECONDS, PROFILE_CACHE_MAX_ENTRIES)
+        if MEMBERS_DB_FILE:
+            self.store = MemberStore(MEMBERS_DB_FILE)
+        self.duplicates_skipped = 0
+        self.already_enriched = 0
+        self.session_renewals = 0
+        self.retry.retries = 0
+        self.dead_letters.count = 0
+        self.metrics.open()
+
+
+
+    def close_stores(self):
+        if self.state:
+            self.state.close()
+            self.state = None
+        cache_hits = self.cache.hits if self.cache else 0
+        if self.cache:
+            print(self.cache.summary())
+            self.cache.close()
+            self.cache = None
+        if self.store:
+            print(self.store.summary())
+            self.store.close()
+            self.store = None
+        if self.retry.retries or self.dead_letters.count:
+            print(f"Retried {self.retry.retries} times, {self.dead_letters.count} profiles written to {self.dead_letters.path}")
+        avoided = self.duplicates_skipped + self.already_enriched + cache_hits
+        print(f"Avoided {avoided} profile fetches: {self.duplicates_skipped} duplicate URLs in the list, "
+              f"{self.already_enriched} already scraped in this run, {cache_hits} served from the profile cache")
+        print(self.blocker.summary())
+        if self.normalizer:
+            print(self.normalizer.summary())
+        if self.metrics.stats.samples:
+            print(f"Latency per step:\n{self.metrics.summary()}")
+        self.metrics.close()
+
+
+
+    def store_sinks(self, run_key, group_url, search=None):
+        """Extra writers that upsert the scraped members into the member database, when one is configured"""
+        if not self.store:
+            return []
+        return [StoreWriter(self.store, run_key, group_url, search, batch_size=SINK_BATCH_SIZE)]
+
+
+
+    def ensure_logged_in(self):
+        """Start the browser and log in once, later jobs of the session reuse the same context"""
+        if self.browser is None:
             self.startBrowser()
             self.login()
-            members_urls = self.get_members_urls(group_url,search)
-            if members_urls:
-                self.save_to_json(members_urls, output_urls_file)
-                members = self.get_members_infos(members_urls)
-                if members:
-                    self.save_to_csv(members, output_members_file)
-                    self.save_to_json(members, output_members_file.replace('.csv', '.json'))
+
+
+
+    def run(self, group_url, output_urls_file,output_members_file,search=None,resume=False):
+        self.open_stores()
+        try:
+            self.scrape_group(group_url, output_urls_file, output_members_file, search, resume)
+        except SessionExpired as e:
+            print(f"Stopped: the session expired again after logging in once ({e}). "
+                  f"The members not scraped yet stay pending, run again with resume=True")
+        finally:
+            self.stop_browser()
+            self.close_stores()
+
+
+
+    def scrape_group(self, group_url, output_urls_file, output_members_file, search=None, resume=False):
+        """Scrape one group into its output files, expects open_stores() to have been called"""
+        state = self.state
+        run_key = state.start(group_url, search, resume=resume)
+        self.run_key = run_key
+        discovered = resume and state.is_discovery_done(run_key)
+        if discovered:
+            pending_urls = state.pending_urls(run_key)
+            total = len(state.discovered_urls(run_key))
+            print(f"Resuming: {total - len(pending_urls)} of {total} members already scraped")
+            if not pending_urls:
+                return
+
+        # Only journal URLs whose records have actually reached disk
+        on_flush = lambda members: state.mark_enriched(run_key, [member['profile_url'] for member in members])
+        with open_writers(output_members_file, OUTPUT_FORMATS, on_flush=on_flush, metrics=self.metrics,
+                          sinks=self.store_sinks(run_key, group_url, search),
+                          batch_size=SINK_BATCH_SIZE, fsync=SINK_FSYNC, append=resume) as writer:
+            if self.engine == "async":
+                self.run_async(group_url, search, writer, state, run_key, pending_urls if discovered else None)
+            else:
+                self.ensure_logged_in()
+                if discovered:
+                    self.write_members(pending_urls, writer)
+                else:
+                    self.discover_and_enrich(group_url, search, writer, state, run_key)
+
+        if writer.count:
+            print(f"Saved {writer.count} members to {', '.join(w.filename for w in writer.writers)}")
+        else:
+            print("No members to save.")
+
+        members_urls = state.discovered_urls(run_key)
+        if members_urls:
+            self.save_to_json(members_urls, output_urls_file)
+
+
+
+    def login_and_save_session(self):
+        self.startBrowser()
+        try:
+            self.login()
+        finally:
+            self.stop_browser()
+
+
+
+    def run_async(self, group_url, search, writer, state, run_key, pending_urls=None):
+        """Drive the async engine, logging in through the sync flow whenever no valid session is saved"""
+        if not self.storage_state_file:
+            raise ValueError("The async engine needs storage_state_file to share the login session")
+        def run_engine(pending_urls):
+            # A fresh engine per event loop, its rate limiter lock is bound to the loop that uses it
+            engine = AsyncGroupsMembersScraper(self, concurrency=self.concurrency, rate=MAX_REQUESTS_PER_SECOND, burst=RATE_BURST)
+            return asyncio.run(engine.run(group_url, search, writer, state, run_key, pending_urls)), engine.completed
+
+        if not os.path.exists(self.storage_state_file):
+            self.login_and_save_session()
+        ok, completed = run_engine(pending_urls)
+        if ok:
+            return
+        print("Session expired, logging in again")
+        writer.flush()
+        self.login_and_save_session()
+        if run_key and state.is_discovery_done(run_key):
+            pending_urls = state.pending_urls(run_key)
+        elif pending_urls is not None:
+            # No journal to ask (dead-letter replay): skip what the first engine already wrote or gave up on
+            pending_urls = [member_url for member_url in pending_urls if member_url not in completed]
+        ok, _ = run_engine(pending_urls)
+        if not ok:
+            print("Login failed: no valid session for the async engine")
+
+
+
+    def discover_and_enrich(self, group_url, search, writer, state, run_key):
+        """Enrich each batch of members as soon as it is harvested, on a second page so the list stays loaded.
+
+        With writer=None the URLs are only journaled in state.
+        """
+        profile_page = self.context.new_page() if STREAM_ENRICHMENT and writer else None
+        backlog = []
+        discovered = 0
+        seen = set()
+        attempt = 0
+        start = time.perf_counter()
+        # Time spent enriching between batches, so get_members_urls only measures the members list
+        enriching = 0.0
+        while True:
+            attempt += 1
+            renewals = self.session_renewals
+            try:
+                for batch in self.iter_members_urls(group_url, search, seen):
+                    discovered += len(batch)
+                    pending_urls = self.queue_batch(batch, state, run_key)
+                    if profile_page:
+                        enrich_start = time.perf_counter()
+                        self.write_members(pending_urls, writer, page=profile_page)
+                        enriching += time.perf_counter() - enrich_start
+                    elif writer:
+                        backlog.extend(pending_urls)
+                state.mark_discovery_done(run_key)
+                self.metrics.observe('get_members_urls', (time.perf_counter() - start - enriching) * 1000, members=discovered)
+                print(f"Scraped {discovered} members urls")
+                break
+            except Exception as e:
+                # Logging in again navigated away from the members list, reopen it
+                if self.session_renewals != renewals:
+                    continue
+                category, delay = self.retry.decide(e, attempt)
+                if category == SESSION_EXPIRED:
+                    if self.renew_session():
+                        continue
+                    raise
+                if delay is None:
+                    self.metrics.observe('get_members_urls', (time.perf_counter() - start - enriching) * 1000, error=e, members=discovered)
+                    print(f"Error scraping members ({category}): {e}")
+                    break
+                print(f"Retrying members list in {delay:.1f}s after {category}")
+                self.page.wait_for_timeout(delay * 1000)
+
+        self.write_members(backlog, writer)
+        if profile_page:
+            profile_page.close()
+
+
+
+    def write_members(self, members_urls, writer, page=None):
+        members = self.get_members_infos(members_urls, page=page)
+        if self.normalizer:
+            members = self.normalizer.stream(members, SINK_BATCH_SIZE)
+        for member in members:
+            writer.write(member)
+
+
+
+    def replay_dead_letters(self, output_members_file):
+        """Enrich the profile URLs earlier runs gave up on, appending them to output_members_file"""
+        started = time.time()
+        entries = self.dead_letters.load()
+        if not entries:
+            print(f"No dead letters to replay in {self.dead_letters.path}")
+            return
+        print(f"Replaying {len(entries)} profiles from {self.dead_letters.path}")
+        run_keys = {entry['url']: entry['run_key'] for entry in entries}
+        recovered = set()
+
+        def on_flush(members):
+            for member in members:
+                recovered.add(member['profile_url'])
+                run_key = run_keys.get(member['profile_url'])
+                if run_key:
+                    self.state.mark_enriched(run_key, [member['profile_url']])
+                    if self.store:
+                        group_url, _, search = run_key.partition('|')
+                        self.store.upsert(run_key, group_url, search or None, [member])
+
+        self.open_stores()
+        self.replay_run_keys = run_keys
+        try:
+            with open_writers(output_members_file, OUTPUT_FORMATS, on_flush=on_flush, metrics=self.metrics,
+                              batch_size=SINK_BATCH_SIZE, fsync=SINK_FSYNC, append=True) as writer:
+                try:
+                    if self.engine == "async":
+                        self.run_async(None, None, writer, self.state, None, list(run_keys))
+                    else:
+                        self.ensure_logged_in()
+                        self.write_members(list(run_keys), writer)
+                except SessionExpired as e:
+                    # What was recovered so far is still dropped from the file below, the rest waits for the next replay
+                    print(f"Stopped: the session expired again after logging in once ({e})")
+            print(f"Recovered {writer.count} of {len(entries)} members into {', '.join(w.filename for w in writer.writers)}")
+            self.dead_letters.remove_before(started, recovered)
         finally:
-            self.stop_browser()
\ No newline at end of file
+            self.replay_run_keys = {}
+            self.stop_browser()
+            self.close_stores()
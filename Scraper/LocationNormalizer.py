@@ -0,0 +1,70 @@
+import random
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List
+from utils.locations import COUNTRY_NAMES, parse_location
+
+
+LOCATION_FIELDS = ('city', 'region', 'country_code')
+
+
+class LocationNormalizer:
+    """Pipeline stage adding city, region and country_code parsed from each member's raw `country` location.
+
+    Locations repeat heavily within a group, so parses are memoized in an LRU cache and every
+    distinct string of a batch is looked up only once.
+    """
+
+    def __init__(self, cache_size: int = 10000, field: str = 'country'):
+        self.field = field
+        self.parse = lru_cache(maxsize=cache_size)(parse_location)
+
+    def normalize(self, members: List[Dict]) -> List[Dict]:
+        """Add the parsed location fields to a batch of members, in place"""
+        parsed = {location: self.parse(location) for location in {member.get(self.field) for member in members}}
+        for member in members:
+            member.update(parsed[member.get(self.field)])
+        return members
+
+    def stream(self, members: Iterable[Dict], batch_size: int = 50) -> Iterator[Dict]:
+        """Normalize members as they stream by, batch_size at a time"""
+        batch = []
+        for member in members:
+            batch.append(member)
+            if len(batch) >= batch_size:
+                yield from self.normalize(batch)
+                batch = []
+        if batch:
+            yield from self.normalize(batch)
+
+    def summary(self) -> str:
+        info = self.parse.cache_info()
+        lookups = info.hits + info.misses
+        return f"Location cache: {info.hits} hits, {info.misses} misses ({info.hits / max(lookups, 1):.0%} hit rate)"
+
+
+def synthetic_locations(rows: int, seed: int = 0) -> List[Dict]:
+    """rows members spread over a few thousand distinct "City, Region, Country" strings in several languages"""
+    rng = random.Random(seed)
+    countries = [name for names in COUNTRY_NAMES.values() for name in names]
+    locations = [f"City {i}, Region {i % 50}, {rng.choice(countries)}" for i in range(2000)]
+    locations += countries + [f"Greater City {i} Area" for i in range(200)]
+    # Skewed like real groups: a few big cities account for most members
+    weights = [1 / (rank + 1) for rank in range(len(locations))]
+    return [{'country': location} for location in rng.choices(locations, weights=weights, k=rows)]
+
+
+if __name__ == "__main__":
+    # python -m Scraper.LocationNormalizer [ROWS] [BATCH_SIZE]  ->  normalized records per second
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    members = synthetic_locations(rows)
+
+    for label, normalizer in (("no cache", LocationNormalizer(cache_size=0)), ("cached", LocationNormalizer())):
+        batch = [dict(member) for member in members]
+        start = time.perf_counter()
+        for _ in normalizer.stream(batch, batch_size):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{label:>8}: {rows} records in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} records/s)  {normalizer.summary()}")
@@ -0,0 +1,152 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterator, List, Optional
+from Scraper.ProfileParser import PROFILE_FIELDS
+from Scraper.Writers import MemberWriter, open_writers
+from utils.urls import canonical_profile_url
+
+
+class MemberStore:
+    """SQLite member database: one row per canonical profile URL, group membership as a separate relation.
+
+    Every profile field gets its own indexed-friendly column next to the full JSON record, so
+    downstream tools can filter, join and dedup across groups with plain SQL.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.fields = [spec['field'] for spec in PROFILE_FIELDS]
+        self.conn = sqlite3.connect(path)
+        # Readers can query the database while a scrape is writing to it
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS members (
+                url TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS groups (
+                run_key TEXT PRIMARY KEY,
+                group_url TEXT NOT NULL,
+                search TEXT
+            );
+            CREATE TABLE IF NOT EXISTS group_members (
+                run_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (run_key, url)
+            );
+            CREATE INDEX IF NOT EXISTS group_members_url ON group_members (url);
+        """)
+        # Fields added to PROFILE_FIELDS later become new columns of an existing database
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(members)")}
+        for field in self.fields:
+            if field not in columns:
+                self.conn.execute(f'ALTER TABLE members ADD COLUMN "{field}" TEXT')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS members_{field} ON members ("{field}")')
+        self.conn.commit()
+
+    def upsert(self, run_key: str, group_url: str, search: Optional[str], members: List[Dict]):
+        """Insert or update a batch of members and their membership of run_key in one transaction"""
+        now = time.time()
+        columns = ", ".join(f'"{field}"' for field in self.fields)
+        placeholders = ", ".join("?" for _ in self.fields)
+        updates = ", ".join(f'"{field}" = excluded."{field}"' for field in self.fields)
+        rows = []
+        for member in members:
+            url = canonical_profile_url(member['profile_url'])
+            rows.append((url, json.dumps(dict(member, profile_url=url), ensure_ascii=False), now, now, *[member.get(field) for field in self.fields]))
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO groups (run_key, group_url, search) VALUES (?, ?, ?)", (run_key, group_url, search))
+            self.conn.executemany(
+                f"INSERT INTO members (url, record, first_seen, updated_at, {columns}) VALUES (?, ?, ?, ?, {placeholders}) "
+                f"ON CONFLICT (url) DO UPDATE SET record = excluded.record, updated_at = excluded.updated_at, {updates}",
+                rows,
+            )
+            self.conn.executemany(
+                "INSERT INTO group_members (run_key, url, first_seen, last_seen) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (run_key, url) DO UPDATE SET last_seen = excluded.last_seen",
+                [(run_key, row[0], now, now) for row in rows],
+            )
+
+    def remove_memberships(self, run_key: str, urls: List[str]):
+        """Forget that urls belong to run_key, their member rows stay for the other groups"""
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM group_members WHERE run_key = ? AND url = ?",
+                [(run_key, canonical_profile_url(url)) for url in urls],
+            )
+
+    def iter_members(self, run_key: Optional[str] = None) -> Iterator[Dict]:
+        """Every stored member, or only those of one (group, search) run"""
+        if run_key is None:
+            rows = self.conn.execute("SELECT record FROM members ORDER BY first_seen, url")
+        else:
+            rows = self.conn.execute(
+                "SELECT m.record FROM members m JOIN group_members g ON g.url = m.url "
+                "WHERE g.run_key = ? ORDER BY g.first_seen, m.url",
+                (run_key,),
+            )
+        for (record,) in rows:
+            yield json.loads(record)
+
+    def export(self, output_file: str, run_key: Optional[str] = None) -> int:
+        """Write the stored members to output_file, the format follows its extension (csv, json, jsonl or parquet)"""
+        fmt = os.path.splitext(output_file)[1].lstrip('.').lower()
+        if fmt == 'parquet':
+            return self.export_parquet(output_file, run_key)
+        with open_writers(output_file, [fmt]) as writer:
+            for member in self.iter_members(run_key):
+                writer.write(member)
+        return writer.count
+
+    def export_parquet(self, output_file: str, run_key: Optional[str] = None) -> int:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow, install it with `pip install pyarrow` or export to csv/json")
+        columns = ['profile_url'] + self.fields
+        members = list(self.iter_members(run_key))
+        table = pyarrow.table({column: [member.get(column) for member in members] for column in columns},
+                              schema=pyarrow.schema([(column, pyarrow.string()) for column in columns]))
+        directory = os.path.dirname(output_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        pyarrow.parquet.write_table(table, output_file)
+        return len(members)
+
+    def summary(self) -> str:
+        members = self.conn.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+        groups = self.conn.execute("SELECT COUNT(*) FROM groups").fetchone()[0]
+        return f"Member store: {members} members across {groups} groups/searches in {self.path}"
+
+    def close(self):
+        self.conn.close()
+
+
+class StoreWriter(MemberWriter):
+    """Sink that upserts each batch into a MemberStore, one transaction per flush"""
+
+    def __init__(self, store: MemberStore, run_key: str, group_url: str, search: Optional[str] = None, **kwargs):
+        super().__init__(store.path, **kwargs)
+        self.store = store
+        self.run_key = run_key
+        self.group_url = group_url
+        self.search = search
+
+    def flush(self):
+        if not self.buffer:
+            return
+        self.store.upsert(self.run_key, self.group_url, self.search, self.buffer)
+        self.buffer = []
+
+    def close(self):
+        self.flush()
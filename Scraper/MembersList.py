@@ -0,0 +1,73 @@
+from typing import List, Optional
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+
+MEMBERS_LIST_SELECTOR = 'ul.artdeco-list.groups-members-list__results-list'
+MEMBER_LINK_SELECTOR = 'a.ember-view.ui-conditional-link-wrapper.ui-entity-action-row__link'
+SHOW_MORE_SELECTOR = 'button:has-text("Show more results"), button:has-text("Afficher plus de résultats")'
+SEARCH_INPUT_SELECTOR = 'input[placeholder="Search members"], input[placeholder="Chercher des membres"]'
+JOIN_BUTTON_SELECTOR = 'button:has(span.a11y-text:has-text("Rejoindre le groupe"))'
+CONTINUE_BUTTON_SELECTOR = 'button:has-text("Continue"), button:has-text("Continuer")'
+
+# Runs inside the page and returns only the hrefs of entries appended since the last call,
+# harvested entries are tagged so the DOM is never serialized nor rescanned from Python
+HARVEST_MEMBERS_HREFS_JS = """
+([listSelector, linkSelector]) => {
+    const list = document.querySelector(listSelector);
+    if (!list) return null;
+    const hrefs = [];
+    for (const li of list.querySelectorAll('li:not([data-harvested])')) {
+        li.setAttribute('data-harvested', '');
+        const link = li.querySelector(linkSelector);
+        if (link && link.getAttribute('href')) hrefs.push(link.getAttribute('href'));
+    }
+    return hrefs;
+}
+"""
+
+
+def parse_members_html(html: str, base_url: str, parser: str = 'lxml') -> Optional[List[str]]:
+    """Extract absolute member profile URLs from a saved members list page"""
+    soup = BeautifulSoup(html, parser)
+    member_elements = soup.select_one(MEMBERS_LIST_SELECTOR)
+    if member_elements is None:
+        return None
+
+    members_urls = []
+    for member in member_elements.find_all('li'):
+        profile_url_elem = member.select_one(MEMBER_LINK_SELECTOR)
+        if profile_url_elem and profile_url_elem.get('href'):
+            members_urls.append(urljoin(base_url, profile_url_elem['href']))
+    return members_urls
+
+
+COUNT_MEMBERS_JS = """
+(listSelector) => {
+    const list = document.querySelector(listSelector);
+    return list ? list.querySelectorAll('li').length : 0;
+}
+"""
+
+# Predicate for wait_for_function: true once "Show more results" appended entries
+MEMBERS_GREW_JS = """
+([listSelector, count]) => {
+    const list = document.querySelector(listSelector);
+    return !!list && list.querySelectorAll('li').length > count;
+}
+"""
+
+MARK_MEMBERS_STALE_JS = """
+(listSelector) => {
+    const list = document.querySelector(listSelector);
+    if (list) list.querySelectorAll('li').forEach(li => li.setAttribute('data-stale', ''));
+}
+"""
+
+# Predicate for wait_for_function: true once a search replaced the entries marked stale
+MEMBERS_REFRESHED_JS = """
+(listSelector) => {
+    const list = document.querySelector(listSelector);
+    return !!list && list.querySelector('li:not([data-stale])') !== null;
+}
+"""
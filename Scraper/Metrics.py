@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from Scraper.Retry import classify
+from Scraper.Waits import LatencyStats
+
+
+class Metrics:
+    """Phase timings, counters and error categories, traced to JSON lines and exposed as Prometheus text"""
+
+    def __init__(self, trace_file: Optional[str] = None, port: int = 0, stats: Optional[LatencyStats] = None):
+        self.trace_file = trace_file
+        self.port = port
+        self.stats = stats or LatencyStats()
+        self.counters = Counter()
+        self.errors = Counter()
+        self.lock = threading.Lock()
+        self.trace = None
+        self.server = None
+
+    def open(self):
+        if self.trace_file:
+            directory = os.path.dirname(self.trace_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.trace = open(self.trace_file, 'a', encoding='utf-8')
+        if self.port:
+            self.serve()
+
+    def close(self):
+        if self.trace:
+            self.trace.close()
+            self.trace = None
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def observe(self, phase: str, elapsed_ms: float, error: Optional[Exception] = None, **attrs):
+        """Record one finished phase, for code that cannot be wrapped in span()"""
+        with self.lock:
+            self.stats.record(phase, elapsed_ms)
+            if error is not None:
+                self.errors[classify(error)] += 1
+            if self.trace:
+                event = {'ts': time.time(), 'phase': phase, 'duration_ms': round(elapsed_ms, 1), 'ok': error is None}
+                if error is not None:
+                    event['error'] = classify(error)
+                    event['message'] = str(error)[:200]
+                event.update(attrs)
+                self.trace.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    @contextmanager
+    def span(self, phase: str, **attrs):
+        """Time the enclosed block, the exception (if any) is recorded and re-raised"""
+        start = time.perf_counter()
+        try:
+            yield attrs
+        except Exception as e:
+            self.observe(phase, (time.perf_counter() - start) * 1000, error=e, **attrs)
+            raise
+        self.observe(phase, (time.perf_counter() - start) * 1000, **attrs)
+
+    def count(self, name: str, value: int = 1):
+        with self.lock:
+            self.counters[name] += value
+
+    def prometheus(self) -> str:
+        lines = ["# TYPE scraper_phase_duration_seconds summary"]
+        with self.lock:
+            # The waiters record into the same stats without this lock, iterate over a snapshot
+            for phase, samples in list(self.stats.samples.items()):
+                for quantile in (50, 95, 99):
+                    lines.append(f'scraper_phase_duration_seconds{{phase="{phase}",quantile="0.{quantile}"}} {self.stats.percentile(phase, quantile) / 1000:.3f}')
+                lines.append(f'scraper_phase_duration_seconds_sum{{phase="{phase}"}} {sum(samples) / 1000:.3f}')
+                lines.append(f'scraper_phase_duration_seconds_count{{phase="{phase}"}} {len(samples)}')
+            lines.append("# TYPE scraper_events_total counter")
+            lines.extend(f'scraper_events_total{{name="{name}"}} {value}' for name, value in self.counters.items())
+            lines.append("# TYPE scraper_errors_total counter")
+            lines.extend(f'scraper_errors_total{{category="{category}"}} {value}' for category, value in self.errors.items())
+        return "\n".join(lines) + "\n"
+
+    def serve(self):
+        """Serve prometheus() on http://127.0.0.1:<port>/metrics from a background thread"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f"Metrics available on http://127.0.0.1:{self.port}/metrics")
+
+    def summary(self) -> str:
+        lines = [self.stats.summary()]
+        if self.counters:
+            lines.append("Counters: " + ", ".join(f"{name}={value}" for name, value in self.counters.items()))
+        if self.errors:
+            lines.append("Errors: " + ", ".join(f"{category}={value}" for category, value in self.errors.most_common()))
+        return "\n".join(lines)
@@ -0,0 +1,95 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+from utils.urls import canonical_profile_url
+
+
+class ProfileCache:
+    """Persistent cache of parsed profiles keyed by normalized profile URL, with TTL and LRU eviction"""
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600, max_entries: int = 100000):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.write_errors = 0
+        # url -> last hit, written with the next put() or close()
+        self.accessed: Dict[str, float] = {}
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS profiles (
+                url TEXT PRIMARY KEY,
+                record TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS profiles_accessed_at ON profiles (accessed_at);
+        """)
+        self.conn.commit()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the cached record when it is still fresh, None when missing or stale"""
+        key = canonical_profile_url(url)
+        row = self.conn.execute("SELECT record, fetched_at FROM profiles WHERE url = ?", (key,)).fetchone()
+        now = time.time()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            self.stale += row is not None
+            return None
+        self.hits += 1
+        # Kept in memory rather than in an open transaction: a hit must neither cost an fsync
+        # nor hold the write lock other jobs sharing the cache file need for their put()
+        self.accessed[key] = now
+        member = json.loads(row[0])
+        member['profile_url'] = url
+        return member
+
+    def put(self, member: Dict):
+        """Cache a fetched profile; a failed write is counted and reported, never raised to the fetch"""
+        now = time.time()
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO profiles (url, record, fetched_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (canonical_profile_url(member['profile_url']), json.dumps(member, ensure_ascii=False), now, now),
+                )
+                self.write_accessed()
+        except sqlite3.Error as e:
+            self.write_errors += 1
+            print(f"Profile cache write failed for {member['profile_url']}: {e}")
+
+    def write_accessed(self):
+        """Write the pending hit times, inside the caller's transaction"""
+        self.conn.executemany("UPDATE profiles SET accessed_at = ? WHERE url = ?", [(ts, url) for url, ts in self.accessed.items()])
+        self.accessed = {}
+
+    def invalidate(self, urls: List[str]):
+        """Forget urls so their next get() misses and the profile is fetched again"""
+        with self.conn:
+            self.conn.executemany("DELETE FROM profiles WHERE url = ?", [(canonical_profile_url(url),) for url in urls])
+
+    def evict(self):
+        """Drop the least recently used entries above max_entries"""
+        with self.conn:
+            self.write_accessed()
+            self.conn.execute(
+                "DELETE FROM profiles WHERE url IN (SELECT url FROM profiles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def summary(self) -> str:
+        errors = f", {self.write_errors} failed writes" if self.write_errors else ""
+        return f"Profile cache: {self.hits} hits, {self.misses} misses ({self.stale} stale){errors}"
+
+    def close(self):
+        try:
+            self.evict()
+        except sqlite3.Error as e:
+            print(f"Profile cache eviction skipped: {e}")
+        self.conn.close()
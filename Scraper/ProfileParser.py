@@ -0,0 +1,101 @@
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+
+
+# Declarative field spec shared by the offline parser and the in-browser extractor:
+# ordered selector fallbacks per field (the first match wins) and a post-processing rule.
+# Class names LinkedIn obfuscates are left out on purpose, they change with every deploy.
+PROFILE_FIELDS: List[Dict] = [
+    {
+        'field': 'name',
+        'selectors': ['h1.inline.t-24.v-align-middle.break-words', 'main section h1', 'h1'],
+        'post': 'text',
+    },
+    {
+        'field': 'headline',
+        'selectors': ['div.text-body-medium.break-words', 'main section div.text-body-medium'],
+        'post': 'text',
+    },
+    {
+        'field': 'country',
+        'selectors': ['span.text-body-small.inline.t-black--light.break-words', 'main section span.text-body-small.t-black--light'],
+        'post': 'text',
+    },
+]
+
+# Evaluates the whole spec in the page and returns the record in a single round-trip
+EXTRACT_PROFILE_JS = """
+(fields) => {
+    const text = el => (el.innerText || el.textContent || '');
+    const post = {
+        text: el => text(el).replace(/\\s+/g, ' ').trim() || null,
+        first_line: el => text(el).split('\\n').map(line => line.trim()).find(Boolean) || null,
+        href: el => el.getAttribute('href'),
+    };
+    const record = {};
+    for (const spec of fields) {
+        record[spec.field] = null;
+        for (const selector of spec.selectors) {
+            const element = document.querySelector(selector);
+            if (element) {
+                record[spec.field] = post[spec.post](element);
+                break;
+            }
+        }
+    }
+    return record;
+}
+"""
+
+
+def clean_text(text: str) -> Optional[str]:
+    text = ' '.join(text.split())
+    return text or None
+
+
+def first_line(text: str) -> Optional[str]:
+    return next((line.strip() for line in text.splitlines() if line.strip()), None)
+
+
+POST_PROCESSORS = {
+    'text': lambda element: clean_text(element.get_text(' ')),
+    'first_line': lambda element: first_line(element.get_text('\n')),
+    'href': lambda element: element.get('href'),
+}
+
+
+def parse_profile(html: str, profile_url: Optional[str] = None, fields: List[Dict] = PROFILE_FIELDS, parser: str = 'lxml') -> Dict:
+    """Extract member fields from a saved profile page, parsing the document only once"""
+    soup = BeautifulSoup(html, parser)
+    member = {}
+    for spec in fields:
+        member[spec['field']] = None
+        for selector in spec['selectors']:
+            element = soup.select_one(selector)
+            if element is not None:
+                member[spec['field']] = POST_PROCESSORS[spec['post']](element)
+                break
+    member['profile_url'] = profile_url
+    return member
+
+
+if __name__ == "__main__":
+    # python -m Scraper.ProfileParser saved/*.html  ->  parsed records and profiles parsed per second
+    files = sys.argv[1:]
+    if not files:
+        sys.exit("usage: python -m Scraper.ProfileParser PROFILE.html [PROFILE.html ...]")
+    pages = []
+    for path in files:
+        with open(path, encoding='utf-8') as f:
+            pages.append((path, f.read()))
+
+    start = time.perf_counter()
+    members = [parse_profile(html, path) for path, html in pages]
+    elapsed = time.perf_counter() - start
+
+    for member in members:
+        print(json.dumps(member, ensure_ascii=False))
+    print(f"Parsed {len(members)} profiles in {elapsed:.3f}s ({len(members) / max(elapsed, 1e-9):.0f} profiles/s)", file=sys.stderr)
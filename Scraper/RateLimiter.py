@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Global request-rate ceiling shared by every page of the async engine, the sync engine uses wait()"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a request may be sent, rate <= 0 disables the limit"""
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            self.refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.refill()
+            self.tokens -= 1
+
+    def wait(self):
+        """Blocking acquire() for the sync engine, which only ever sends one request at a time"""
+        if self.rate <= 0:
+            return
+        self.refill()
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.refill()
+        self.tokens -= 1
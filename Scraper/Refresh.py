@@ -0,0 +1,162 @@
+import os
+import time
+from typing import Dict, List
+from config.config import OUTPUT_FORMATS, SINK_BATCH_SIZE, SINK_FSYNC, REFRESH_SAMPLE_SIZE, REFRESH_MIN_RATIO
+from Scraper.BatchRunner import read_members
+from Scraper.ProfileParser import PROFILE_FIELDS
+from Scraper.Retry import SessionExpired
+from Scraper.Writers import open_writers
+from utils.urls import canonical_profile_url
+
+
+JOINED = "joined"
+LEFT = "left"
+UPDATED = "updated"
+
+
+def rotating_sample(urls: List[str], start: int, size: int) -> List[str]:
+    """size URLs from start, wrapping around, so successive refreshes cycle through every member"""
+    if not urls or size <= 0:
+        return []
+    return [urls[(start + i) % len(urls)] for i in range(min(size, len(urls)))]
+
+
+def changed(previous: Dict, member: Dict) -> bool:
+    # CSV round-trips None as '', so compare both sides as "value or None"
+    return any((previous.get(spec['field']) or None) != (member.get(spec['field']) or None) for spec in PROFILE_FIELDS)
+
+
+class Refresh:
+    """Brings a group's master dataset up to date by enriching only the members that changed.
+
+    The previous master file is the snapshot: the group is rediscovered, members that joined since are
+    enriched, members that left stay in the master with the date they left in `left_at`, and a rotating
+    sample of the others is fetched again to catch headline or location edits. Every change also goes to
+    a delta file tagged with `change`.
+
+    A discovered list smaller than min_ratio of the current members more likely means the list did not
+    load than a mass departure, so the master is left untouched unless the refresh is forced.
+    """
+
+    def __init__(self, scraper, sample_size: int = REFRESH_SAMPLE_SIZE, min_ratio: float = REFRESH_MIN_RATIO):
+        self.scraper = scraper
+        self.sample_size = sample_size
+        self.min_ratio = min_ratio
+
+    def run(self, group_url, output_urls_file, output_members_file, delta_file, search=None, force=False):
+        scraper = self.scraper
+        scraper.open_stores()
+        try:
+            self.refresh(group_url, output_urls_file, output_members_file, delta_file, search, force)
+        except SessionExpired as e:
+            print(f"Stopped: the session expired again after logging in once ({e}), the master dataset was left untouched")
+        finally:
+            scraper.stop_browser()
+            scraper.close_stores()
+
+    def refresh(self, group_url, output_urls_file, output_members_file, delta_file, search=None, force=False):
+        scraper = self.scraper
+        state = scraper.state
+        start = time.perf_counter()
+        previous = {canonical_profile_url(member['profile_url']): member for member in read_members(output_members_file)}
+        # CSV reads a missing left_at back as ''
+        active = [url for url, member in previous.items() if not member.get('left_at')]
+
+        run_key = state.start(group_url, search)
+        scraper.run_key = run_key
+        scraper.ensure_logged_in()
+        scraper.discover_and_enrich(group_url, search, None, state, run_key)
+        if not state.is_discovery_done(run_key):
+            # A partial list would report everyone it missed as having left
+            print("Members list was not fully loaded, the master dataset was left untouched")
+            return
+        discovered = state.discovered_urls(run_key)
+        if not force and (not discovered or len(discovered) < self.min_ratio * len(active)):
+            print(f"Only {len(discovered)} members found for {len(active)} in the master dataset, it was left untouched "
+                  f"(run with force to accept the new list)")
+            return
+        scraper.save_to_json(discovered, output_urls_file)
+
+        current = set(discovered)
+        # Members who left before and are back count as joined
+        joined = [url for url in discovered if url not in previous or previous[url].get('left_at')]
+        left = [url for url in active if url not in current]
+        stayed = sorted(url for url in active if url in current)
+        # Their records are in the master already, a later resumed scrape of the group must not fetch them again
+        state.mark_enriched(run_key, stayed)
+        cursor = state.refresh_cursor(run_key)
+        sample = rotating_sample(stayed, cursor, self.sample_size)
+        print(f"Refresh: {len(joined)} joined, {len(left)} left, re-fetching {len(sample)} of {len(stayed)} existing members")
+
+        if scraper.cache:
+            scraper.cache.invalidate(sample)
+        fetched = self.fetch(joined + sample, output_members_file, state, run_key, group_url, search)
+        if scraper.store:
+            scraper.store.remove_memberships(run_key, left)
+        if stayed:
+            state.set_refresh_cursor(run_key, (cursor + len(sample)) % len(stayed))
+
+        today = time.strftime('%Y-%m-%d')
+        fetched = {url: dict(member, left_at=None) for url, member in fetched.items()}
+        delta = [dict(fetched[url], change=JOINED) for url in joined if url in fetched]
+        delta += [dict(previous[url], left_at=today, change=LEFT) for url in left]
+        updated = [url for url in sample if url in fetched and changed(previous[url], fetched[url])]
+        delta += [dict(fetched[url], change=UPDATED) for url in updated]
+        self.write(delta_file, delta)
+
+        # Members whose fetch failed keep their previous record, joiners that failed wait for the next refresh
+        left = set(left)
+        master = []
+        for url, member in previous.items():
+            if url in fetched:
+                master.append(fetched[url])
+            elif url in left:
+                master.append(dict(member, left_at=today))
+            else:
+                master.append(dict(member, left_at=member.get('left_at') or None))
+        master += [fetched[url] for url in joined if url in fetched and url not in previous]
+        self.write(output_members_file, master, replace=True)
+
+        elapsed = time.perf_counter() - start
+        scraper.metrics.observe('refresh', elapsed * 1000, joined=len(joined), left=len(left), updated=len(updated), sampled=len(sample))
+        print(f"Refreshed {len(master)} members in {elapsed:.1f}s: {len(delta)} changes written to {delta_file}")
+
+    def fetch(self, urls: List[str], output_members_file: str, state, run_key, group_url, search=None) -> Dict[str, Dict]:
+        """Enrich urls through the configured engine, staging records in a JSON Lines file next to the master"""
+        if not urls:
+            return {}
+        scraper = self.scraper
+        base, _ = os.path.splitext(output_members_file)
+        staging = f"{base}.refresh.jsonl"
+        on_flush = lambda members: state.mark_enriched(run_key, [member['profile_url'] for member in members])
+        with open_writers(staging, ['jsonl'], on_flush=on_flush, metrics=scraper.metrics,
+                          sinks=scraper.store_sinks(run_key, group_url, search),
+                          batch_size=SINK_BATCH_SIZE, fsync=SINK_FSYNC) as writer:
+            if scraper.engine == "async":
+                # Discovery ran on the sync browser, which saved the session the async engine starts from
+                scraper.stop_browser()
+                scraper.run_async(None, None, writer, state, run_key, urls)
+            else:
+                scraper.write_members(urls, writer)
+        fetched = {canonical_profile_url(member['profile_url']): member for member in read_members(staging)}
+        if os.path.exists(staging):
+            os.remove(staging)
+        return fetched
+
+    def write(self, output_file: str, members: List[Dict], replace: bool = False):
+        """Write members in every output format, through temporary files swapped in at the end.
+
+        Without records the previous file is removed, so no stale delta is left behind, except with
+        replace: an empty master is never a reason to delete the dataset.
+        """
+        base, ext = os.path.splitext(output_file)
+        with open_writers(f"{base}.tmp{ext}", OUTPUT_FORMATS, batch_size=SINK_BATCH_SIZE, fsync=SINK_FSYNC) as writer:
+            for member in members:
+                writer.write(member)
+        for w in writer.writers:
+            final = w.filename.replace(f"{base}.tmp", base, 1)
+            # Writers create their file on the first record
+            if os.path.exists(w.filename):
+                os.replace(w.filename, final)
+            elif not replace and os.path.exists(final):
+                os.remove(final)
@@ -0,0 +1,62 @@
+from collections import Counter
+from typing import List
+from playwright.sync_api import BrowserContext, Response, Route
+
+
+class ResourceBlocker:
+    """Aborts requests the scraper never reads (images, fonts, trackers...) on a whole browser context"""
+
+    def __init__(self, resource_types: List[str], url_patterns: List[str], metrics=None):
+        self.resource_types = set(filter(None, resource_types))
+        self.url_patterns = [pattern for pattern in url_patterns if pattern]
+        self.enabled = True
+        self.blocked = Counter()
+        self.transferred_bytes = 0
+        self.metrics = metrics
+
+    def install(self, context: BrowserContext):
+        context.route("**/*", self.handle)
+        context.on("response", self.count_response)
+
+    async def install_async(self, context):
+        """Same policy on a playwright.async_api context"""
+        await context.route("**/*", self.handle_async)
+        context.on("response", self.count_response)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        return resource_type in self.resource_types or any(pattern in url for pattern in self.url_patterns)
+
+    def handle(self, route: Route):
+        request = route.request
+        if self.enabled and self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            if self.metrics:
+                self.metrics.count('blocked_requests')
+            route.abort()
+        else:
+            route.continue_()
+
+    async def handle_async(self, route):
+        request = route.request
+        if self.enabled and self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            if self.metrics:
+                self.metrics.count('blocked_requests')
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def count_response(self, response: Response):
+        # Content-Length comes with the response event, reading the body would cost an extra round-trip
+        length = response.headers.get('content-length')
+        if length and length.isdigit():
+            self.transferred_bytes += int(length)
+            if self.metrics:
+                self.metrics.count('transferred_bytes', int(length))
+
+    def summary(self) -> str:
+        blocked = ", ".join(f"{resource_type}: {count}" for resource_type, count in self.blocked.most_common())
+        return (
+            f"Blocked {sum(self.blocked.values())} requests ({blocked or 'none'}), "
+            f"{self.transferred_bytes / 1024:.0f} KB transferred"
+        )
@@ -0,0 +1,120 @@
+import json
+import os
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+TIMEOUT = "timeout"
+NAVIGATION = "navigation"
+LAYOUT_CHANGED = "layout_changed"
+SESSION_EXPIRED = "session_expired"
+
+RETRYABLE = (TIMEOUT, NAVIGATION)
+
+# Where LinkedIn sends a request whose session is no longer valid
+AUTH_URL_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/")
+
+
+class SessionExpired(Exception):
+    pass
+
+
+class LayoutChanged(Exception):
+    pass
+
+
+def check_session(url: str):
+    if any(marker in url for marker in AUTH_URL_MARKERS):
+        raise SessionExpired(f"Redirected to {url}")
+
+
+def classify(error: Exception) -> str:
+    """Sort a failure into timeout, navigation, layout_changed, session_expired or its exception name"""
+    if isinstance(error, SessionExpired):
+        return SESSION_EXPIRED
+    if isinstance(error, LayoutChanged):
+        return LAYOUT_CHANGED
+    # The async API raises the same TimeoutError class as the sync one
+    if isinstance(error, PlaywrightTimeoutError):
+        return TIMEOUT
+    if "net::ERR_" in str(error) or "NS_ERROR_" in str(error):
+        return NAVIGATION
+    if isinstance(error, PlaywrightError) and "Navigation" in str(error):
+        return NAVIGATION
+    return type(error).__name__
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for retryable failures, within a per-run retry budget"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0, budget: int = 200):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retries = 0
+
+    def decide(self, error: Exception, attempt: int) -> Tuple[str, Optional[float]]:
+        """Return the failure category and how long to wait before retrying, None to give up"""
+        category = classify(error)
+        if category not in RETRYABLE or attempt >= self.max_attempts or self.retries >= self.budget:
+            return category, None
+        self.retries += 1
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return category, delay * random.uniform(0.5, 1.5)
+
+
+class DeadLetters:
+    """Append-only JSON-lines file of profile URLs that failed for good, replayable by a later run"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+
+    def add(self, url: str, category: str, error: Exception, attempts: int, run_key: Optional[str] = None):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({
+                'url': url,
+                'run_key': run_key,
+                'category': category,
+                'error': str(error)[:500],
+                'attempts': attempts,
+                'ts': time.time(),
+            }, ensure_ascii=False) + '\n')
+        self.count += 1
+
+    def load(self) -> List[Dict]:
+        """Latest entry per URL"""
+        if not os.path.exists(self.path):
+            return []
+        latest = {}
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    latest[entry['url']] = entry
+        return list(latest.values())
+
+    def remove_before(self, ts: float, replayed: Optional[Iterable[str]] = None):
+        """Drop entries written before ts, once they have been replayed; failures of the replay itself stay.
+
+        With replayed, only the entries of those URLs and of the ones that failed again since ts are dropped,
+        entries the replay never got to stay for the next one.
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            entries = [(line, json.loads(line)) for line in f if line.strip()]
+        if replayed is not None:
+            replayed = set(replayed) | {entry['url'] for _, entry in entries if entry['ts'] >= ts}
+        kept = [line for line, entry in entries if entry['ts'] >= ts or (replayed is not None and entry['url'] not in replayed)]
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.writelines(kept)
+        os.replace(tmp, self.path)
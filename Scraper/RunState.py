@@ -0,0 +1,101 @@
+import os
+import sqlite3
+from typing import List, Optional
+
+
+class RunState:
+    """SQLite journal of discovered and enriched profile URLs, keyed by group URL and search term"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_key TEXT PRIMARY KEY,
+                group_url TEXT NOT NULL,
+                search TEXT,
+                discovery_done INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                run_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                enriched INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (run_key, url)
+            );
+            CREATE TABLE IF NOT EXISTS refresh_cursors (
+                run_key TEXT PRIMARY KEY,
+                position INTEGER NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def run_key(group_url: str, search: Optional[str] = None) -> str:
+        return f"{group_url.rstrip('/')}|{search or ''}"
+
+    def start(self, group_url: str, search: Optional[str] = None, resume: bool = False) -> str:
+        """Register a run and return its key, wiping previous progress unless resuming"""
+        key = self.run_key(group_url, search)
+        with self.conn:
+            if not resume:
+                self.conn.execute("DELETE FROM urls WHERE run_key = ?", (key,))
+                self.conn.execute("DELETE FROM runs WHERE run_key = ?", (key,))
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs (run_key, group_url, search) VALUES (?, ?, ?)",
+                (key, group_url, search),
+            )
+        return key
+
+    def add_discovered(self, key: str, urls: List[str]) -> List[str]:
+        """Journal newly discovered URLs and return those that still need enriching"""
+        start = self.conn.execute("SELECT COUNT(*) FROM urls WHERE run_key = ?", (key,)).fetchone()[0]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO urls (run_key, url, position) VALUES (?, ?, ?)",
+                [(key, url, start + i) for i, url in enumerate(urls)],
+            )
+        return [
+            url for url in urls
+            if not self.conn.execute("SELECT enriched FROM urls WHERE run_key = ? AND url = ?", (key, url)).fetchone()[0]
+        ]
+
+    def mark_discovery_done(self, key: str):
+        with self.conn:
+            self.conn.execute("UPDATE runs SET discovery_done = 1 WHERE run_key = ?", (key,))
+
+    def is_discovery_done(self, key: str) -> bool:
+        row = self.conn.execute("SELECT discovery_done FROM runs WHERE run_key = ?", (key,)).fetchone()
+        return bool(row and row[0])
+
+    def discovered_urls(self, key: str) -> List[str]:
+        rows = self.conn.execute("SELECT url FROM urls WHERE run_key = ? ORDER BY position", (key,))
+        return [row[0] for row in rows]
+
+    def pending_urls(self, key: str) -> List[str]:
+        rows = self.conn.execute("SELECT url FROM urls WHERE run_key = ? AND enriched = 0 ORDER BY position", (key,))
+        return [row[0] for row in rows]
+
+    def mark_enriched(self, key: str, urls: List[str]):
+        if not urls:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE urls SET enriched = 1 WHERE run_key = ? AND url = ?",
+                [(key, url) for url in urls],
+            )
+
+    def refresh_cursor(self, key: str) -> int:
+        """Where the next refresh sample starts; kept apart from runs so start() never resets it"""
+        row = self.conn.execute("SELECT position FROM refresh_cursors WHERE run_key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def set_refresh_cursor(self, key: str, position: int):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO refresh_cursors (run_key, position) VALUES (?, ?)", (key, position))
+
+    def close(self):
+        self.conn.close()
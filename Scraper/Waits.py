@@ -0,0 +1,118 @@
+import asyncio
+import bisect
+import math
+import random
+import time
+from typing import Dict, List, Optional
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+HISTOGRAM_BUCKETS_MS = [100, 250, 500, 1000, 2000, 5000, 10000]
+
+
+class LatencyStats:
+    """Per-step latency samples with histogram and percentile summaries"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    def record(self, step: str, elapsed_ms: float):
+        bisect.insort(self.samples.setdefault(step, []), elapsed_ms)
+
+    def percentile(self, step: str, pct: float) -> float:
+        """Nearest-rank percentile: the smallest sample with at least pct% of the samples at or below it"""
+        samples = self.samples.get(step) or [0.0]
+        return samples[max(0, math.ceil(len(samples) * pct / 100) - 1)]
+
+    def histogram(self, step: str) -> Dict[str, int]:
+        counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        for sample in self.samples.get(step, []):
+            counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, sample)] += 1
+        labels = [f"<={bucket}ms" for bucket in HISTOGRAM_BUCKETS_MS] + [f">{HISTOGRAM_BUCKETS_MS[-1]}ms"]
+        return dict(zip(labels, counts))
+
+    def summary(self) -> str:
+        lines = []
+        for step, samples in self.samples.items():
+            lines.append(
+                f"{step}: n={len(samples)} total={sum(samples) / 1000:.1f}s mean={sum(samples) / len(samples):.0f}ms "
+                f"p50={self.percentile(step, 50):.0f}ms p95={self.percentile(step, 95):.0f}ms "
+                f"p99={self.percentile(step, 99):.0f}ms max={samples[-1]:.0f}ms"
+            )
+            lines.append("    " + " ".join(f"{label}:{count}" for label, count in self.histogram(step).items() if count))
+        return "\n".join(lines)
+
+
+class AdaptiveWaiter:
+    """Waits for a condition instead of sleeping, but never returns faster than a politeness delay"""
+
+    def __init__(self, timeout_ms: int = 10000, min_delay_ms: int = 250, stats: Optional[LatencyStats] = None):
+        self.timeout_ms = timeout_ms
+        self.min_delay_ms = min_delay_ms
+        self.stats = stats or LatencyStats()
+
+    def wait_for_selector(self, page: Page, step: str, selector: str, timeout_ms: Optional[int] = None) -> bool:
+        """Return as soon as selector is attached to the DOM, False on timeout"""
+        start = time.perf_counter()
+        try:
+            page.wait_for_selector(selector, state='attached', timeout=timeout_ms or self.timeout_ms)
+            found = True
+        except PlaywrightTimeoutError:
+            found = False
+        self.finish(page, step, start)
+        return found
+
+    def wait_for_function(self, page: Page, step: str, expression: str, arg=None, timeout_ms: Optional[int] = None) -> bool:
+        """Return as soon as the JS predicate is truthy, False on timeout"""
+        start = time.perf_counter()
+        try:
+            page.wait_for_function(expression, arg=arg, timeout=timeout_ms or self.timeout_ms)
+            found = True
+        except PlaywrightTimeoutError:
+            found = False
+        self.finish(page, step, start)
+        return found
+
+    def pause(self, page: Page, step: str):
+        """Plain politeness delay for steps with nothing to wait on"""
+        self.finish(page, step, time.perf_counter())
+
+    def finish(self, page: Page, step: str, start: float):
+        self.stats.record(step, (time.perf_counter() - start) * 1000)
+        remaining = self.min_delay_ms * random.uniform(1.0, 1.5) - (time.perf_counter() - start) * 1000
+        if remaining > 0:
+            page.wait_for_timeout(remaining)
+
+
+class AsyncAdaptiveWaiter(AdaptiveWaiter):
+    """AdaptiveWaiter for playwright.async_api pages, sharing the same latency stats"""
+
+    async def wait_for_selector(self, page, step: str, selector: str, timeout_ms: Optional[int] = None) -> bool:
+        start = time.perf_counter()
+        try:
+            await page.wait_for_selector(selector, state='attached', timeout=timeout_ms or self.timeout_ms)
+            found = True
+        except PlaywrightTimeoutError:
+            found = False
+        await self.finish(page, step, start)
+        return found
+
+    async def wait_for_function(self, page, step: str, expression: str, arg=None, timeout_ms: Optional[int] = None) -> bool:
+        start = time.perf_counter()
+        try:
+            await page.wait_for_function(expression, arg=arg, timeout=timeout_ms or self.timeout_ms)
+            found = True
+        except PlaywrightTimeoutError:
+            found = False
+        await self.finish(page, step, start)
+        return found
+
+    async def pause(self, page, step: str):
+        await self.finish(page, step, time.perf_counter())
+
+    async def finish(self, page, step: str, start: float):
+        self.stats.record(step, (time.perf_counter() - start) * 1000)
+        remaining = self.min_delay_ms * random.uniform(1.0, 1.5) - (time.perf_counter() - start) * 1000
+        if remaining > 0:
+            await asyncio.sleep(remaining / 1000)
@@ -0,0 +1,240 @@
+import csv
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+FSYNC_POLICIES = ("never", "flush", "close")
+
+
+class MemberWriter:
+    """Base class for sinks that write member records as they are scraped"""
+
+    def __init__(self, filename: str, batch_size: int = 50, fsync: str = "flush", append: bool = False):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}, expected one of {FSYNC_POLICIES}")
+        self.filename = filename
+        self.batch_size = max(1, batch_size)
+        self.fsync = fsync
+        self.append = append
+        self.buffer: List[Dict] = []
+        self.count = 0
+        self.file = None
+
+    def open(self):
+        """Open the underlying file, called lazily on the first flush"""
+        directory = os.path.dirname(self.filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        mode = 'a' if self.appending() else 'w'
+        self.file = open(self.filename, mode, newline='', encoding='utf-8')
+
+    def appending(self) -> bool:
+        """True when records should be added after the ones already in the file"""
+        return self.append and os.path.exists(self.filename) and os.path.getsize(self.filename) > 0
+
+    def write(self, member: Dict):
+        self.buffer.append(member)
+        self.count += 1
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.file is None:
+            self.open()
+        self.write_batch(self.buffer)
+        self.buffer = []
+        self.file.flush()
+        if self.fsync == "flush":
+            os.fsync(self.file.fileno())
+
+    def write_batch(self, members: List[Dict]):
+        raise NotImplementedError
+
+    def finalize(self):
+        """Write any trailing content needed to make the file valid"""
+        pass
+
+    def close(self):
+        self.flush()
+        if self.file is None:
+            return
+        self.finalize()
+        self.file.flush()
+        if self.fsync != "never":
+            os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CsvWriter(MemberWriter):
+    def __init__(self, filename: str, fieldnames: Optional[List[str]] = None, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.fieldnames = fieldnames
+        self.dict_writer = None
+
+    def open(self):
+        header = None
+        if self.appending():
+            with open(self.filename, newline='', encoding='utf-8') as existing:
+                header = next(csv.reader(existing), None)
+        super().open()
+        if header:
+            self.fieldnames = header
+            self.dict_writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, extrasaction='ignore')
+
+    def write_batch(self, members: List[Dict]):
+        if self.dict_writer is None:
+            if self.fieldnames is None:
+                self.fieldnames = list(members[0].keys())
+            self.dict_writer = csv.DictWriter(self.file, fieldnames=self.fieldnames, extrasaction='ignore')
+            self.dict_writer.writeheader()
+        self.dict_writer.writerows(members)
+
+
+class JsonLinesWriter(MemberWriter):
+    def write_batch(self, members: List[Dict]):
+        self.file.write(''.join(json.dumps(member, ensure_ascii=False) + '\n' for member in members))
+
+
+class JsonArrayWriter(MemberWriter):
+    """Streams a JSON array, the closing bracket is written by finalize()"""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.written = 0
+
+    def open(self):
+        if not self.appending():
+            return super().open()
+        # surrogateescape round-trips a multi-byte character torn by the crash, byte offsets stay exact
+        with open(self.filename, encoding='utf-8', errors='surrogateescape') as existing:
+            content = existing.read().rstrip()
+        recovered = self.recover(content)
+        if recovered is None:
+            # The records in it were already reported as saved, starting over would silently lose them
+            raise ValueError(f"Cannot resume {self.filename}: it does not end like a file this writer produced, "
+                             f"repair it or run without resume")
+        content, self.written = recovered
+        if not self.written:
+            self.file = open(self.filename, 'w', newline='', encoding='utf-8')
+            return
+        self.file = open(self.filename, 'r+', newline='', encoding='utf-8')
+        self.file.seek(len(content.encode('utf-8', 'surrogateescape')))
+        self.file.truncate()
+
+    @staticmethod
+    def recover(content: str) -> Optional[Tuple[str, int]]:
+        """The part of an existing array to keep, without its closing bracket, and how many items it holds.
+
+        Items are written whole as ',\n    {...\n    }', so a crash leaves at most one torn item after the
+        last complete one: only that tail is dropped. None when the file does not match that layout.
+        """
+        # A run that crashed never wrote the closing bracket
+        if content.endswith(']'):
+            content = content[:-1].rstrip()
+        if content in ('', '['):
+            return '', 0
+        try:
+            return content, len(json.loads(content + '\n]'))
+        except ValueError:
+            pass
+        end = content.rfind('\n    }')
+        if end < 0:
+            # Torn before the first item was complete, nothing in the file was ever reported as saved
+            return ('', 0) if content.startswith('[\n    {') else None
+        content = content[:end + len('\n    }')]
+        try:
+            return content, len(json.loads(content + '\n]'))
+        except ValueError:
+            return None
+
+    def write_batch(self, members: List[Dict]):
+        chunks = []
+        for member in members:
+            item = json.dumps(member, ensure_ascii=False, indent=4).replace('\n', '\n    ')
+            chunks.append(('[\n    ' if self.written == 0 else ',\n    ') + item)
+            self.written += 1
+        self.file.write(''.join(chunks))
+
+    def finalize(self):
+        self.file.write('\n]' if self.written else '[]')
+
+
+class MultiWriter:
+    """Fans every record out to several sinks"""
+
+    def __init__(self, writers: List[MemberWriter], on_flush: Optional[Callable[[List[Dict]], None]] = None, metrics=None):
+        self.writers = writers
+        self.on_flush = on_flush
+        self.metrics = metrics
+        self.unflushed: List[Dict] = []
+
+    @property
+    def count(self) -> int:
+        return self.writers[0].count if self.writers else 0
+
+    @property
+    def pending(self) -> bool:
+        """True while some records are still buffered and not yet on disk"""
+        return any(writer.buffer for writer in self.writers)
+
+    def write(self, member: Dict):
+        start = time.perf_counter()
+        for writer in self.writers:
+            writer.write(member)
+        self.unflushed.append(member)
+        if not self.pending:
+            if self.metrics:
+                self.metrics.observe('save', (time.perf_counter() - start) * 1000, records=len(self.unflushed))
+            self.notify_flushed()
+
+    def flush(self):
+        for writer in self.writers:
+            writer.flush()
+        self.notify_flushed()
+
+    def notify_flushed(self):
+        """Report the records that have reached every sink since the last call"""
+        if self.on_flush and self.unflushed:
+            self.on_flush(self.unflushed)
+        self.unflushed = []
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+        self.notify_flushed()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+WRITERS = {
+    'csv': CsvWriter,
+    'jsonl': JsonLinesWriter,
+    'json': JsonArrayWriter,
+}
+
+
+def open_writers(output_members_file: str, formats: List[str], on_flush: Optional[Callable[[List[Dict]], None]] = None, metrics=None,
+                 sinks: Optional[List[MemberWriter]] = None, **kwargs) -> MultiWriter:
+    """Build one writer per format, deriving each filename from output_members_file, plus any extra sinks"""
+    base, _ = os.path.splitext(output_members_file)
+    writers = []
+    for fmt in filter(None, formats):
+        if fmt not in WRITERS:
+            raise ValueError(f"Unknown output format {fmt!r}, expected one of {list(WRITERS)}")
+        writers.append(WRITERS[fmt](f"{base}.{fmt}", **kwargs))
+    return MultiWriter(writers + (sinks or []), on_flush=on_flush, metrics=metrics)
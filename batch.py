@@ -0,0 +1,13 @@
+import sys
+from config.config import LINKEDIN_EMAIL, LINKEDIN_PASSWORD
+from Scraper.GroupsMembersScraper import GroupsMembersScraper
+from Scraper.BatchRunner import BatchRunner, load_jobs
+
+
+
+if len(sys.argv) < 2:
+    sys.exit("usage: python batch.py JOBS.jsonl|JOBS.yaml [COMBINED_OUTPUT.csv]")
+
+scraper = GroupsMembersScraper(LINKEDIN_EMAIL, LINKEDIN_PASSWORD)
+
+BatchRunner(scraper).run(load_jobs(sys.argv[1]), sys.argv[2] if len(sys.argv) > 2 else "data/combined_members.csv")
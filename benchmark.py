@@ -0,0 +1,102 @@
+import csv
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# End-to-end benchmark against the local mock server, no credentials or network needed:
+#   python benchmark.py [MEMBERS ...]          (default: 100 1000 10000)
+# Every size is scraped by each engine in BENCHMARK_ENGINES under the same MAX_REQUESTS_PER_SECOND cap,
+# so the async engine's gain is measured at a fixed request rate rather than against an unthrottled run.
+# Each size runs in its own child process (benchmark.py --one MEMBERS WORKDIR): ru_maxrss never goes down,
+# so sizes measured one after the other in a single process would all report the largest peak so far.
+# Every store lives in a throwaway directory so runs never touch data/ nor hit the profile cache.
+# The sync engine fetches one profile per MOCK_LATENCY_MS round trip at best, so its 10000 run is the long one:
+# pass smaller sizes, or BENCHMARK_ENGINES=async, for a quick comparison.
+LATENCY_MS = float(os.getenv("MOCK_LATENCY_MS", "250"))
+RATE_CAP = os.environ.setdefault("MAX_REQUESTS_PER_SECOND", "10")
+ENGINES = os.getenv("BENCHMARK_ENGINES", "sync,async").split(",")
+
+
+def scrape(size, workdir):
+    """Scrape a mock group of `size` members in this process and return its measurements"""
+    for name, value in {
+        "RUN_STATE_FILE": os.path.join(workdir, "run_state.sqlite3"),
+        "STORAGE_STATE_FILE": os.path.join(workdir, "storage_state.json"),
+        "MEMBERS_DB_FILE": os.path.join(workdir, "members.sqlite3"),
+        "METRICS_TRACE_FILE": os.path.join(workdir, "trace.jsonl"),
+        "PROFILE_CACHE_FILE": "",
+        "HEADLESS": "true",
+        "WAIT_MIN_DELAY_MS": "0",
+    }.items():
+        os.environ.setdefault(name, value)
+
+    # config reads the environment when it is first imported
+    from Scraper.GroupsMembersScraper import GroupsMembersScraper
+    from utils.mock_linkedin import MockLinkedInServer
+
+    server = MockLinkedInServer(members=size, latency_ms=LATENCY_MS).start()
+    output_members_file = os.path.join(workdir, f"members_{size}.csv")
+    scraper = GroupsMembersScraper("benchmark@example.com", "benchmark", base_url=server.base_url)
+
+    start = time.perf_counter()
+    scraper.run(f"{server.base_url}groups/1/", os.path.join(workdir, f"urls_{size}.json"), output_members_file)
+    elapsed = time.perf_counter() - start
+    server.stop()
+
+    with open(output_members_file, newline='', encoding='utf-8') as f:
+        scraped = sum(1 for _ in csv.DictReader(f))
+    return {
+        'engine': scraper.engine,
+        'members': size,
+        'scraped': scraped,
+        'seconds': elapsed,
+        'members_per_minute': scraped / elapsed * 60,
+        # ru_maxrss is in KiB on Linux; RUSAGE_CHILDREN covers the browser processes, all exited by now
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'peak_browser_rss_mb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024,
+        'transferred_mb': scraper.blocker.transferred_bytes / 1024 / 1024,
+        'requests': server.requests,
+        'requests_per_second': server.requests / elapsed,
+    }
+
+
+def main(argv):
+    if argv[:1] == ["--one"]:
+        size, workdir = int(argv[1]), argv[2]
+        with open(os.path.join(workdir, "result.json"), 'w', encoding='utf-8') as f:
+            json.dump(scrape(size, workdir), f)
+        return
+
+    sizes = [int(arg) for arg in argv] or [100, 1000, 10000]
+    root = tempfile.mkdtemp(prefix="scraper-benchmark-")
+    results = []
+    for size in sizes:
+        for engine in ENGINES:
+            workdir = os.path.join(root, f"{engine}_{size}")
+            os.makedirs(workdir)
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--one", str(size), workdir],
+                           env=dict(os.environ, ENGINE=engine), check=True)
+            with open(os.path.join(workdir, "result.json"), encoding='utf-8') as f:
+                results.append(json.load(f))
+
+    print(f"\nRate cap={RATE_CAP} requests/s latency={LATENCY_MS:.0f}ms outputs in {root}")
+    print(f"{'engine':>6} {'members':>8} {'scraped':>8} {'seconds':>9} {'members/min':>12} {'requests/s':>11} {'peak RSS MB':>12} "
+          f"{'browser RSS MB':>15} {'transferred MB':>15} {'requests':>9}")
+    for r in results:
+        print(f"{r['engine']:>6} {r['members']:>8} {r['scraped']:>8} {r['seconds']:>9.1f} {r['members_per_minute']:>12.0f} "
+              f"{r['requests_per_second']:>11.1f} {r['peak_rss_mb']:>12.0f} {r['peak_browser_rss_mb']:>15.0f} "
+              f"{r['transferred_mb']:>15.1f} {r['requests']:>9}")
+
+    seconds = {(r['engine'], r['members']): r['seconds'] for r in results}
+    for size in sizes:
+        if ('sync', size) in seconds and ('async', size) in seconds:
+            print(f"{size} members: async is {seconds['sync', size] / seconds['async', size]:.1f}x faster than sync "
+                  f"at {RATE_CAP} requests/s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
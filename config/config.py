@@ -5,4 +5,39 @@ dotenv.load_dotenv()
 
 LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
 LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+BASE_URL = os.getenv("BASE_URL", "https://www.linkedin.com/")
 
+
+OUTPUT_FORMATS = os.getenv("OUTPUT_FORMATS", "csv,json").split(",")
+SINK_BATCH_SIZE = int(os.getenv("SINK_BATCH_SIZE", "50"))
+SINK_FSYNC = os.getenv("SINK_FSYNC", "flush")
+RUN_STATE_FILE = os.getenv("RUN_STATE_FILE", "data/run_state.sqlite3")
+MEMBERS_EXTRACTION = os.getenv("MEMBERS_EXTRACTION", "evaluate")
+PROFILE_EXTRACTION = os.getenv("PROFILE_EXTRACTION", "evaluate")
+STREAM_ENRICHMENT = os.getenv("STREAM_ENRICHMENT", "true").lower() == "true"
+WAIT_TIMEOUT_MS = int(os.getenv("WAIT_TIMEOUT_MS", "10000"))
+WAIT_MIN_DELAY_MS = int(os.getenv("WAIT_MIN_DELAY_MS", "250"))
+BLOCKED_RESOURCE_TYPES = os.getenv("BLOCKED_RESOURCE_TYPES", "image,media,font").split(",")
+BLOCKED_URL_PATTERNS = os.getenv("BLOCKED_URL_PATTERNS", "/li/track,px.ads.linkedin.com,doubleclick.net,google-analytics.com,/sensorCollect").split(",")
+NAVIGATION_WAIT_UNTIL = os.getenv("NAVIGATION_WAIT_UNTIL", "domcontentloaded")
+HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+STORAGE_STATE_FILE = os.getenv("STORAGE_STATE_FILE", "data/storage_state.json")
+ENGINE = os.getenv("ENGINE", "sync")
+CONCURRENCY = int(os.getenv("CONCURRENCY", "3"))
+MAX_REQUESTS_PER_SECOND = float(os.getenv("MAX_REQUESTS_PER_SECOND", "0.5"))
+RATE_BURST = int(os.getenv("RATE_BURST", "1"))
+PROFILE_CACHE_FILE = os.getenv("PROFILE_CACHE_FILE", "data/profile_cache.sqlite3")
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("PROFILE_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("PROFILE_CACHE_MAX_ENTRIES", "100000"))
+MEMBERS_DB_FILE = os.getenv("MEMBERS_DB_FILE", "data/members.sqlite3")
+METRICS_TRACE_FILE = os.getenv("METRICS_TRACE_FILE", "data/trace.jsonl")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "2.0"))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "60.0"))
+RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", "200"))
+DEAD_LETTER_FILE = os.getenv("DEAD_LETTER_FILE", "data/dead_letters.jsonl")
+REFRESH_SAMPLE_SIZE = int(os.getenv("REFRESH_SAMPLE_SIZE", "50"))
+REFRESH_MIN_RATIO = float(os.getenv("REFRESH_MIN_RATIO", "0.5"))
+NORMALIZE_LOCATIONS = os.getenv("NORMALIZE_LOCATIONS", "true").lower() == "true"
+LOCATION_CACHE_SIZE = int(os.getenv("LOCATION_CACHE_SIZE", "10000"))
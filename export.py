@@ -0,0 +1,18 @@
+import sys
+from config.config import MEMBERS_DB_FILE
+from Scraper.MemberStore import MemberStore
+from Scraper.RunState import RunState
+
+
+
+if len(sys.argv) < 2 or not MEMBERS_DB_FILE:
+    sys.exit("usage: python export.py OUTPUT.csv|.json|.jsonl|.parquet [GROUP_URL] [SEARCH]  (needs MEMBERS_DB_FILE)")
+
+output_file = sys.argv[1]
+run_key = RunState.run_key(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None) if len(sys.argv) > 2 else None
+
+store = MemberStore(MEMBERS_DB_FILE)
+try:
+    print(f"Exported {store.export(output_file, run_key)} members from {MEMBERS_DB_FILE} to {output_file}")
+finally:
+    store.close()
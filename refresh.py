@@ -0,0 +1,21 @@
+import sys
+from config.config import LINKEDIN_EMAIL, LINKEDIN_PASSWORD
+from Scraper.GroupsMembersScraper import GroupsMembersScraper
+from Scraper.Refresh import Refresh
+
+
+
+# --force accepts a members list much smaller than the master dataset (REFRESH_MIN_RATIO)
+force = "--force" in sys.argv[1:]
+args = [arg for arg in sys.argv[1:] if arg != "--force"]
+if len(args) < 2:
+    sys.exit("usage: python refresh.py [--force] GROUP_URL MEMBERS.csv [DELTA.csv] [SEARCH]")
+
+group_url, output_members_file = args[0], args[1]
+base = output_members_file.rsplit('.', 1)[0]
+delta_file = args[2] if len(args) > 2 else f"{base}_delta.csv"
+search = args[3] if len(args) > 3 else None
+
+scraper = GroupsMembersScraper(LINKEDIN_EMAIL, LINKEDIN_PASSWORD)
+
+Refresh(scraper).run(group_url, f"{base}_urls.json", output_members_file, delta_file, search, force=force)
@@ -0,0 +1,35 @@
+import os
+import sys
+import pytest
+
+# Run from anywhere: the Scraper, utils and config packages live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def profile_url(i):
+    return f"https://www.linkedin.com/in/member-{i}/"
+
+
+def urls(*ids):
+    return [profile_url(i) for i in ids]
+
+
+def member(i, **fields):
+    """A scraped member record, fields override or add to the defaults"""
+    return dict({'name': f"Member {i}", 'headline': f"Headline {i}", 'country': "Paris, Île-de-France, France",
+                 'profile_url': profile_url(i)}, **fields)
+
+
+@pytest.fixture(scope="module")
+def page():
+    """A Chromium page for the in-page extraction tests, skipped where no browser is installed"""
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except sync_api.Error as e:
+            pytest.skip(f"Chromium is not available: {str(e).splitlines()[0]}")
+        yield browser.new_page()
+        browser.close()
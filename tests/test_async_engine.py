@@ -0,0 +1,132 @@
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+from Scraper.AsyncGroupsMembersScraper import AsyncGroupsMembersScraper
+from Scraper.RateLimiter import TokenBucket
+from Scraper.Waits import AdaptiveWaiter
+from conftest import profile_url, urls
+
+
+class Page:
+    async def close(self):
+        pass
+
+
+class Context:
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    async def new_page(self):
+        if self.fail:
+            raise RuntimeError("browser closed")
+        return Page()
+
+
+class Writer:
+    def __init__(self, fail_after=None):
+        self.members = []
+        self.fail_after = fail_after
+
+    def write(self, member):
+        if self.fail_after is not None and len(self.members) >= self.fail_after:
+            raise OSError("No space left on device")
+        self.members.append(member)
+
+
+def engine(concurrency=3, context=None):
+    scraper = SimpleNamespace(waiter=AdaptiveWaiter(timeout_ms=1000, min_delay_ms=0), normalizer=None)
+    engine = AsyncGroupsMembersScraper(scraper, concurrency=concurrency, rate=0)
+    engine.context = context or Context()
+
+    async def fetch(page, member_url):
+        await asyncio.sleep(0)
+        return {'profile_url': member_url}
+
+    engine.get_member_info_with_retry = fetch
+    return engine
+
+
+def run(coroutine):
+    # A hang is the bug these tests guard against, fail fast instead of blocking the suite
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+def test_enrich_writes_every_member():
+    writer = Writer()
+    run(engine().write_members(urls(*range(50)), writer))
+    assert sorted(member['profile_url'] for member in writer.members) == sorted(urls(*range(50)))
+
+
+def test_worker_failure_surfaces_instead_of_hanging():
+    writer = Writer(fail_after=5)
+    with pytest.raises(OSError):
+        # Far more URLs than the bounded queue holds, the producer would block forever on put()
+        run(engine().write_members(urls(*range(500)), writer))
+
+
+def test_page_failure_surfaces_instead_of_hanging():
+    with pytest.raises(RuntimeError):
+        run(engine(context=Context(fail=True)).write_members(urls(*range(500)), Writer()))
+
+
+def test_producer_failure_stops_the_workers():
+    async def produce(queue):
+        await queue.put(profile_url(0))
+        raise ValueError("members list broke")
+
+    with pytest.raises(ValueError):
+        run(engine().enrich(produce, Writer()))
+
+
+def test_token_bucket_caps_the_rate():
+    async def acquire(bucket, n):
+        start = time.perf_counter()
+        for _ in range(n):
+            await bucket.acquire()
+        return time.perf_counter() - start
+
+    # The first token is available at once, the next four arrive at 20 per second
+    assert 0.18 <= asyncio.run(acquire(TokenBucket(20, burst=1), 5)) < 0.5
+    assert asyncio.run(acquire(TokenBucket(20, burst=5), 5)) < 0.05
+    assert asyncio.run(acquire(TokenBucket(0), 1000)) < 0.05
+
+
+def test_token_bucket_is_shared_by_concurrent_pages():
+    async def pages(bucket, workers, each):
+        start = time.perf_counter()
+        await asyncio.gather(*[acquire(bucket, each) for _ in range(workers)])
+        return time.perf_counter() - start
+
+    async def acquire(bucket, n):
+        for _ in range(n):
+            await bucket.acquire()
+
+    # 3 pages x 3 requests at 30 per second: the cap applies to their total, not to each page
+    assert asyncio.run(pages(TokenBucket(30), 3, 3)) >= 8 / 30 - 0.02
+
+
+def test_token_bucket_wait_caps_the_sync_engine():
+    bucket = TokenBucket(20, burst=1)
+    start = time.perf_counter()
+    for _ in range(5):
+        bucket.wait()
+    assert 0.18 <= time.perf_counter() - start < 0.5
+
+
+def test_completed_tracks_written_and_dead_lettered_urls():
+    async def fetch(page, member_url):
+        await asyncio.sleep(0)
+        if member_url.endswith("-3/"):
+            # Dead-lettered: gives up without expiring the session
+            return None
+        if member_url.endswith("-6/"):
+            pool.session_expired = True
+            return None
+        return {'profile_url': member_url}
+
+    pool = engine(concurrency=1)
+    pool.get_member_info_with_retry = fetch
+    run(pool.write_members(urls(*range(10)), Writer()))
+    # Written or given up on before the session expired, a restarted run only needs the rest
+    assert pool.completed == set(urls(*range(6)))
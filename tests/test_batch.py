@@ -0,0 +1,108 @@
+import json
+import pytest
+from Scraper.BatchRunner import BatchRunner, load_jobs, read_members
+from Scraper.Retry import SessionExpired
+from Scraper.Writers import open_writers
+from conftest import member, profile_url
+
+
+class FakeScraper:
+    """Writes outputs[output] for each scrape_group call, or raises errors[output]"""
+
+    def __init__(self, outputs, errors=None):
+        self.outputs = outputs
+        self.errors = errors or {}
+        self.scraped = []
+
+    def open_stores(self):
+        pass
+
+    def stop_browser(self):
+        pass
+
+    def close_stores(self):
+        pass
+
+    def scrape_group(self, group_url, output_urls_file, output_members_file, search, resume):
+        self.scraped.append(output_members_file)
+        with open_writers(output_members_file, ['csv']) as writer:
+            for record in self.outputs.get(output_members_file, []):
+                writer.write(record)
+        if output_members_file in self.errors:
+            raise self.errors[output_members_file]
+
+
+def jobs(tmp_path, n):
+    return [{'group_url': f"https://www.linkedin.com/groups/{i}/", 'output': str(tmp_path / f"job_{i}.csv")}
+            for i in range(1, n + 1)]
+
+
+def combined(tmp_path):
+    return [record['profile_url'] for record in read_members(str(tmp_path / "combined.csv"))]
+
+
+def test_load_jobs_from_json_lines(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"group_url": "https://www.linkedin.com/groups/1/", "output": "a.csv", "search": "data"}\n\n'
+                    '{"group_url": "https://www.linkedin.com/groups/2/", "output": "b.csv"}\n', encoding='utf-8')
+    assert load_jobs(str(path)) == [
+        {'group_url': "https://www.linkedin.com/groups/1/", 'output': "a.csv", 'search': "data"},
+        {'group_url': "https://www.linkedin.com/groups/2/", 'output': "b.csv"},
+    ]
+
+
+def test_load_jobs_from_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "jobs.yaml"
+    path.write_text("- group_url: https://www.linkedin.com/groups/1/\n  output: a.csv\n  resume: true\n", encoding='utf-8')
+    assert load_jobs(str(path)) == [{'group_url': "https://www.linkedin.com/groups/1/", 'output': "a.csv", 'resume': True}]
+
+
+def test_load_jobs_rejects_a_job_without_output(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text(json.dumps({'group_url': "https://www.linkedin.com/groups/1/"}) + '\n', encoding='utf-8')
+    with pytest.raises(ValueError, match="Job 1 .* missing output"):
+        load_jobs(str(path))
+
+
+def test_a_failed_job_does_not_stop_the_batch(tmp_path):
+    batch = jobs(tmp_path, 3)
+    scraper = FakeScraper({batch[0]['output']: [member(1)], batch[2]['output']: [member(3)]},
+                          errors={batch[1]['output']: RuntimeError("members list did not load")})
+    failed = BatchRunner(scraper).run(batch, str(tmp_path / "combined.csv"))
+    assert failed == [2]
+    assert scraper.scraped == [job['output'] for job in batch]
+    assert combined(tmp_path) == [profile_url(1), profile_url(3)]
+
+
+def test_combined_output_is_deduplicated_across_jobs(tmp_path):
+    batch = jobs(tmp_path, 2)
+    scraper = FakeScraper({batch[0]['output']: [member(1), member(2)],
+                           batch[1]['output']: [member(2, profile_url="https://fr.linkedin.com/in/member-2?trk=x"), member(3)]})
+    assert BatchRunner(scraper).run(batch, str(tmp_path / "combined.csv")) == []
+    assert combined(tmp_path) == [profile_url(1), profile_url(2), profile_url(3)]
+
+
+def test_stale_output_of_a_failed_job_is_not_combined(tmp_path):
+    batch = jobs(tmp_path, 2)
+    # Left over from an earlier batch, this batch fails before writing job 2 again
+    with open_writers(batch[1]['output'], ['csv']) as writer:
+        writer.write(member(9))
+    scraper = FakeScraper({batch[0]['output']: [member(1)]}, errors={batch[1]['output']: RuntimeError("authwall")})
+    assert BatchRunner(scraper).run(batch, str(tmp_path / "combined.csv")) == [2]
+    assert combined(tmp_path) == [profile_url(1)]
+
+
+def test_members_saved_by_a_failed_job_are_combined(tmp_path):
+    batch = jobs(tmp_path, 1)
+    scraper = FakeScraper({batch[0]['output']: [member(1)]}, errors={batch[0]['output']: RuntimeError("crashed")})
+    assert BatchRunner(scraper).run(batch, str(tmp_path / "combined.csv")) == [1]
+    assert combined(tmp_path) == [profile_url(1)]
+
+
+def test_expired_session_stops_the_remaining_jobs(tmp_path):
+    batch = jobs(tmp_path, 3)
+    scraper = FakeScraper({batch[0]['output']: [member(1)]}, errors={batch[1]['output']: SessionExpired("authwall")})
+    assert BatchRunner(scraper).run(batch, str(tmp_path / "combined.csv")) == [2, 3]
+    assert scraper.scraped == [batch[0]['output'], batch[1]['output']]
+    assert combined(tmp_path) == [profile_url(1)]
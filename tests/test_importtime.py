@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+import pytest
+
+
+# Start-up cost of the CLI, batch and refresh entry points, measured with python -X importtime in a fresh interpreter.
+# The captcha libraries are heavy and should only load when a challenge shows up.
+BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+HEAVY_MODULES = ("cv2", "numpy", "PIL")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_timings(module):
+    """(cumulative_us, self_us, name) for every module that importing `module` loads"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stderr.strip().splitlines()[-1]
+    # Lines look like "import time:  self [us] | cumulative | imported package", nesting shown by indentation
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative_us), int(self_us), name.strip()))
+    return timings
+
+
+@pytest.mark.parametrize("module", ["Scraper.GroupsMembersScraper", "Scraper.BatchRunner", "Scraper.Refresh"])
+def test_entry_point_imports_stay_light(module):
+    timings = import_timings(module)
+    heavy = sorted({name.split(".")[0] for _, _, name in timings} & set(HEAVY_MODULES))
+    assert not heavy, f"{module} loads {', '.join(heavy)} at import time"
+
+    total_ms = next(cumulative for cumulative, _, name in timings if name == module) / 1000
+    slowest = "\n".join(f"    {cumulative / 1000:>8.1f}ms {self_us / 1000:>8.1f}ms self  {name}"
+                        for cumulative, self_us, name in sorted(timings, reverse=True)[:10])
+    assert total_ms <= BUDGET_MS, f"{module} takes {total_ms:.0f}ms to import (budget {BUDGET_MS:.0f}ms):\n{slowest}"
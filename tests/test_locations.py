@@ -0,0 +1,52 @@
+import pytest
+from Scraper.LocationNormalizer import LocationNormalizer, synthetic_locations
+from utils.locations import country_code, fold, parse_location
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("Paris, Île-de-France, France", ("Paris", "Île-de-France", "FR")),
+    ("Casablanca, Casablanca-Settat, Maroc", ("Casablanca", "Casablanca-Settat", "MA")),
+    ("Bavaria, Germany", (None, "Bavaria", "DE")),
+    ("Vereinigte Staaten", (None, None, "US")),
+    ("Greater Paris Metropolitan Region", (None, "Greater Paris Metropolitan Region", None)),
+    (" São Paulo ,  São Paulo, Brasil ", ("São Paulo", "São Paulo", "BR")),
+    ("", (None, None, None)),
+    (None, (None, None, None)),
+])
+def test_parse_location(location, expected):
+    assert parse_location(location) == dict(zip(('city', 'region', 'country_code'), expected))
+
+
+def test_country_lookup_ignores_accents_case_and_separators():
+    assert fold("États-Unis") == fold("etats unis") == "etats unis"
+    assert country_code("ETATS UNIS") == "US"
+    assert country_code("Cote d’Ivoire") == "CI"
+    assert country_code("Atlantis") is None
+
+
+def test_normalizer_adds_fields_in_place_and_caches():
+    normalizer = LocationNormalizer(cache_size=10)
+    members = [{'country': "Paris, Île-de-France, France"}, {'country': "Paris, Île-de-France, France"}, {'country': None}]
+    assert normalizer.normalize(members) is members
+    assert members[0] == {'country': "Paris, Île-de-France, France", 'city': "Paris", 'region': "Île-de-France", 'country_code': "FR"}
+    assert members[2]['country_code'] is None
+    # Each distinct location of a batch is parsed once, later batches hit the cache
+    normalizer.normalize([{'country': "Paris, Île-de-France, France"}])
+    info = normalizer.parse.cache_info()
+    assert (info.misses, info.hits) == (2, 1)
+
+
+def test_stream_keeps_order_across_batches():
+    members = synthetic_locations(120, seed=1)
+    streamed = list(LocationNormalizer().stream([dict(member) for member in members], batch_size=50))
+    assert [member['country'] for member in streamed] == [member['country'] for member in members]
+    assert all('country_code' in member for member in streamed)
+
+
+@pytest.mark.parametrize("cache_size", [0, 10000])
+def test_benchmark_normalize(benchmark, cache_size):
+    """10,000 records per round, so OPS x 10,000 is records normalized per second"""
+    members = synthetic_locations(10000)
+    normalizer = LocationNormalizer(cache_size=cache_size)
+    benchmark.group = "location normalization, 10000 records"
+    benchmark(lambda: sum(1 for _ in normalizer.stream([dict(member) for member in members])))
@@ -0,0 +1,70 @@
+import json
+import pytest
+import Scraper.MemberStore as member_store
+from Scraper.MemberStore import MemberStore, StoreWriter
+from conftest import member, urls
+
+
+FIRST = "https://www.linkedin.com/groups/1/|"
+SECOND = "https://www.linkedin.com/groups/2/|shakira"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MemberStore(str(tmp_path / "members.sqlite3"))
+    yield store
+    store.close()
+
+
+def stored_urls(members):
+    return [m['profile_url'] for m in members]
+
+
+def test_upsert_dedups_url_variants_across_groups(store):
+    store.upsert(FIRST, "https://www.linkedin.com/groups/1/", None, [member(1), member(2)])
+    variant = dict(member(1, headline="New headline"), profile_url="https://fr.linkedin.com/in/Member-1?trk=x")
+    store.upsert(SECOND, "https://www.linkedin.com/groups/2/", "shakira", [variant])
+
+    assert stored_urls(store.iter_members()) == urls(1, 2)
+    assert next(store.iter_members())['headline'] == "New headline"
+    assert stored_urls(store.iter_members(SECOND)) == urls(1)
+    assert store.conn.execute('SELECT headline FROM members WHERE url = ?', (member(1)['profile_url'],)).fetchone() == ("New headline",)
+    assert store.summary().startswith("Member store: 2 members across 2 groups/searches")
+
+
+def test_remove_memberships_keeps_the_member(store):
+    store.upsert(FIRST, "https://www.linkedin.com/groups/1/", None, [member(1)])
+    store.upsert(SECOND, "https://www.linkedin.com/groups/2/", "shakira", [member(1)])
+    store.remove_memberships(FIRST, urls(1))
+    assert list(store.iter_members(FIRST)) == []
+    assert stored_urls(store.iter_members(SECOND)) == urls(1)
+
+
+def test_new_profile_fields_become_columns(tmp_path, monkeypatch):
+    path = str(tmp_path / "members.sqlite3")
+    MemberStore(path).close()
+    monkeypatch.setattr(member_store, "PROFILE_FIELDS", member_store.PROFILE_FIELDS + [{'field': 'about', 'selectors': [], 'post': 'text'}])
+    store = MemberStore(path)
+    assert 'about' in {row[1] for row in store.conn.execute("PRAGMA table_info(members)")}
+    store.close()
+
+
+def test_store_writer_upserts_per_flush(store):
+    writer = StoreWriter(store, FIRST, "https://www.linkedin.com/groups/1/", batch_size=2)
+    writer.write(member(1))
+    assert list(store.iter_members()) == []
+    writer.write(member(2))
+    writer.write(member(3))
+    assert len(list(store.iter_members())) == 2
+    writer.close()
+    assert stored_urls(store.iter_members(FIRST)) == urls(1, 2, 3)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "jsonl"])
+def test_export(store, tmp_path, fmt):
+    store.upsert(FIRST, "https://www.linkedin.com/groups/1/", None, [member(1), member(2)])
+    output_file = str(tmp_path / f"members.{fmt}")
+    assert store.export(output_file, FIRST) == 2
+    if fmt == "json":
+        with open(output_file, encoding='utf-8') as f:
+            assert json.load(f) == [member(1), member(2)]
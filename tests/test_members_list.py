@@ -0,0 +1,91 @@
+import os
+import re
+import pytest
+from Scraper.MembersList import HARVEST_MEMBERS_HREFS_JS, MEMBER_LINK_SELECTOR, MEMBERS_LIST_SELECTOR, parse_members_html
+from conftest import FIXTURES_DIR
+
+
+BASE_URL = "https://www.linkedin.com/"
+EXPECTED_HREFS = [
+    "/in/amina-el-idrissi/",
+    "https://www.linkedin.com/in/jose-garcia-5b1a2c/?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAB",
+    "/in/ACoAABcdEfGhIjKlMnOpQrStUvWxYz/",
+    "/in/sarah-o-connor/",
+]
+EXPECTED_URLS = [
+    "https://www.linkedin.com/in/amina-el-idrissi/",
+    "https://www.linkedin.com/in/jose-garcia-5b1a2c/?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAB",
+    "https://www.linkedin.com/in/ACoAABcdEfGhIjKlMnOpQrStUvWxYz/",
+    "https://www.linkedin.com/in/sarah-o-connor/",
+]
+# Entries in a fully scrolled list, like the pages the two extraction paths are compared on
+LARGE_LIST_SIZES = [500, 2000]
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES_DIR, "members", name), encoding='utf-8') as f:
+        return f.read()
+
+
+def large_list(entries):
+    """The saved page with its rows repeated until the list holds `entries` members"""
+    html = fixture("members_list.html")
+    rows = re.findall(r'<li class="artdeco-list__item.*?</li>', html, re.S)
+    repeated = [re.sub(r'href="/in/([^/"]+)/"', rf'href="/in/\1-{i}/"', rows[i % len(rows)]) for i in range(entries)]
+    start, end = html.index(rows[0]), html.index(rows[-1]) + len(rows[-1])
+    return html[:start] + "\n".join(repeated) + html[end:]
+
+
+def harvest(page):
+    return page.evaluate(HARVEST_MEMBERS_HREFS_JS, [MEMBERS_LIST_SELECTOR, MEMBER_LINK_SELECTOR])
+
+
+def test_lxml_path_extracts_member_links():
+    assert parse_members_html(fixture("members_list.html"), BASE_URL) == EXPECTED_URLS
+
+
+def test_parsers_agree():
+    html = large_list(1000)
+    assert parse_members_html(html, BASE_URL, parser='html.parser') == parse_members_html(html, BASE_URL)
+
+
+def test_missing_list_returns_none():
+    assert parse_members_html("<html><body><main><h1>Feed</h1></main></body></html>", BASE_URL) is None
+
+
+def test_evaluate_path_matches_lxml_path(page):
+    page.set_content(fixture("members_list.html"))
+    assert harvest(page) == EXPECTED_HREFS
+    # Entries are tagged once harvested, a second call only returns what was appended since
+    assert harvest(page) == []
+    page.evaluate("""(selector) => {
+        const li = document.createElement('li');
+        li.innerHTML = '<a class="ember-view ui-conditional-link-wrapper ui-entity-action-row__link" href="/in/new-member/">New</a>';
+        document.querySelector(selector).appendChild(li);
+    }""", MEMBERS_LIST_SELECTOR)
+    assert harvest(page) == ["/in/new-member/"]
+
+
+def test_evaluate_path_without_list_returns_none(page):
+    page.set_content("<main><h1>Feed</h1></main>")
+    assert harvest(page) is None
+
+
+@pytest.mark.parametrize("entries", LARGE_LIST_SIZES)
+@pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+def test_benchmark_page_content_parse(benchmark, entries, parser):
+    """The page.content() + BeautifulSoup path; the serialized DOM is what page.content() would return"""
+    html = large_list(entries)
+    benchmark.group = f"members list, {entries} entries"
+    urls = benchmark(parse_members_html, html, BASE_URL, parser)
+    assert len(urls) == entries - entries // 5
+
+
+@pytest.mark.parametrize("entries", LARGE_LIST_SIZES)
+def test_benchmark_evaluate(benchmark, page, entries):
+    """The in-page path: one page.evaluate returning only the hrefs"""
+    page.set_content(large_list(entries))
+    benchmark.group = f"members list, {entries} entries"
+    untag = lambda: page.evaluate("() => document.querySelectorAll('li[data-harvested]').forEach(li => li.removeAttribute('data-harvested'))")
+    hrefs = benchmark.pedantic(harvest, args=(page,), setup=untag, rounds=20)
+    assert len(hrefs) == entries - entries // 5
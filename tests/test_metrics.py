@@ -0,0 +1,103 @@
+import asyncio
+import time
+import pytest
+import Scraper.GroupsMembersScraper as sync_engine
+from Scraper.AsyncGroupsMembersScraper import AsyncGroupsMembersScraper
+from Scraper.GroupsMembersScraper import GroupsMembersScraper
+from Scraper.Metrics import Metrics
+from Scraper.RunState import RunState
+from conftest import urls
+
+
+GROUP = "https://www.linkedin.com/groups/39683/"
+ENRICH_SECONDS = 0.1
+
+
+class Page:
+    def close(self):
+        pass
+
+
+class AsyncPage:
+    async def close(self):
+        pass
+
+
+class Context:
+    def new_page(self):
+        return Page()
+
+
+class AsyncContext:
+    async def new_page(self):
+        return AsyncPage()
+
+
+class Writer:
+    def __init__(self):
+        self.members = []
+
+    def write(self, member):
+        self.members.append(member)
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = GroupsMembersScraper("member@example.com", "password")
+    scraper.normalizer = None
+    scraper.context = Context()
+    scraper.state = RunState(str(tmp_path / "run_state.sqlite3"))
+    yield scraper
+    scraper.state.close()
+
+
+def discovery_ms(scraper):
+    return scraper.metrics.stats.samples['get_members_urls'][0]
+
+
+def test_waits_and_phases_share_one_summary(scraper):
+    scraper.waiter.stats.record('profile', 120)
+    scraper.metrics.observe('fetch_profile', 480)
+    assert set(scraper.metrics.stats.samples) == {'profile', 'fetch_profile'}
+    summary = scraper.metrics.summary()
+    assert summary.count("profile: n=1") == 2
+    assert 'phase="profile"' in scraper.metrics.prometheus()
+
+
+def test_metrics_keeps_its_own_stats_by_default():
+    metrics = Metrics()
+    metrics.observe('save', 5)
+    assert metrics.stats.samples == {'save': [5]}
+
+
+def test_streamed_discovery_excludes_enrichment_time(scraper, monkeypatch):
+    monkeypatch.setattr(sync_engine, "STREAM_ENRICHMENT", True)
+    monkeypatch.setattr(scraper, "iter_members_urls", lambda group_url, search, seen: iter([urls(1, 2), urls(3)]))
+    monkeypatch.setattr(scraper, "write_members", lambda members_urls, writer, page=None: time.sleep(ENRICH_SECONDS))
+    run_key = scraper.state.start(GROUP)
+
+    scraper.discover_and_enrich(GROUP, None, Writer(), scraper.state, run_key)
+    assert scraper.state.is_discovery_done(run_key)
+    assert discovery_ms(scraper) < ENRICH_SECONDS * 1000 / 2
+
+
+def test_async_discovery_excludes_time_blocked_on_the_queue(scraper):
+    engine = AsyncGroupsMembersScraper(scraper, concurrency=1, rate=0)
+    engine.context = AsyncContext()
+
+    async def iter_members_urls(group_url, search, seen):
+        yield urls(*range(10))
+
+    async def fetch(page, member_url):
+        await asyncio.sleep(ENRICH_SECONDS / 5)
+        return {'profile_url': member_url}
+
+    engine.iter_members_urls = iter_members_urls
+    engine.get_member_info_with_retry = fetch
+    run_key = scraper.state.start(GROUP)
+    writer = Writer()
+
+    # One worker and a queue of 4: the producer waits on put() for most of the 10 fetches
+    asyncio.run(asyncio.wait_for(engine.discover_and_enrich(GROUP, None, writer, scraper.state, run_key), timeout=5))
+    assert len(writer.members) == 10
+    assert discovery_ms(scraper) < ENRICH_SECONDS * 1000 / 2
@@ -0,0 +1,76 @@
+import sqlite3
+import time
+from Scraper.ProfileCache import ProfileCache
+from conftest import member, profile_url
+
+
+def cache(tmp_path, **kwargs):
+    return ProfileCache(str(tmp_path / "profile_cache.sqlite3"), **kwargs)
+
+
+def cached_urls(cache):
+    return [url for (url,) in cache.conn.execute("SELECT url FROM profiles ORDER BY url")]
+
+
+def test_hit_returns_the_record_under_the_requested_url(tmp_path):
+    profiles = cache(tmp_path)
+    profiles.put(member(1))
+    variant = "https://fr.linkedin.com/in/Member-1/?trk=x"
+    assert profiles.get(variant) == member(1, profile_url=variant)
+    assert profiles.get(profile_url(2)) is None
+    assert (profiles.hits, profiles.misses, profiles.stale) == (1, 1, 0)
+    profiles.close()
+
+
+def test_expired_entries_miss_and_count_as_stale(tmp_path):
+    profiles = cache(tmp_path, ttl_seconds=60)
+    profiles.put(member(1))
+    profiles.conn.execute("UPDATE profiles SET fetched_at = ?", (time.time() - 61,))
+    assert profiles.get(profile_url(1)) is None
+    assert (profiles.hits, profiles.misses, profiles.stale) == (0, 1, 1)
+    profiles.close()
+
+
+def test_evict_drops_the_least_recently_used(tmp_path):
+    profiles = cache(tmp_path, max_entries=2)
+    for i in range(1, 4):
+        profiles.put(member(i))
+        profiles.conn.execute("UPDATE profiles SET accessed_at = ? WHERE url = ?", (i, profile_url(i)))
+    # A hit makes member-1 the most recently used, member-2 is now the oldest
+    assert profiles.get(profile_url(1))
+    profiles.evict()
+    assert cached_urls(profiles) == [profile_url(1), profile_url(3)]
+    profiles.close()
+
+
+def test_invalidate_forgets_urls(tmp_path):
+    profiles = cache(tmp_path)
+    profiles.put(member(1))
+    profiles.invalidate(["https://www.linkedin.com/in/MEMBER-1"])
+    assert profiles.get(profile_url(1)) is None
+    profiles.close()
+
+
+def test_hits_do_not_lock_out_other_jobs(tmp_path):
+    first, second = cache(tmp_path), cache(tmp_path)
+    first.put(member(1))
+    assert first.get(profile_url(1))
+    assert not first.conn.in_transaction
+    second.put(member(2))
+    assert second.write_errors == 0
+    first.close()
+    second.close()
+    assert sorted(cached_urls(cache(tmp_path))) == [profile_url(1), profile_url(2)]
+
+
+def test_failed_writes_never_reach_the_fetch(tmp_path):
+    profiles = cache(tmp_path)
+    profiles.conn.execute("PRAGMA busy_timeout = 0")
+    other = sqlite3.connect(str(tmp_path / "profile_cache.sqlite3"))
+    other.execute("BEGIN EXCLUSIVE")
+    profiles.put(member(1))
+    assert profiles.write_errors == 1
+    assert "1 failed writes" in profiles.summary()
+    other.rollback()
+    other.close()
+    profiles.close()
@@ -0,0 +1,55 @@
+import json
+import os
+import pytest
+from Scraper.ProfileParser import EXTRACT_PROFILE_JS, PROFILE_FIELDS, parse_profile
+from conftest import FIXTURES_DIR
+
+
+PROFILES_DIR = os.path.join(FIXTURES_DIR, "profiles")
+with open(os.path.join(PROFILES_DIR, "expected.json"), encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+
+def fixture(name):
+    with open(os.path.join(PROFILES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_parse_profile(name):
+    url = f"https://www.linkedin.com/in/{name}/"
+    assert parse_profile(fixture(name), url) == dict(EXPECTED[name], profile_url=url)
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_in_page_extraction_matches_parser(page, name):
+    page.set_content(fixture(name))
+    assert page.evaluate(EXTRACT_PROFILE_JS, PROFILE_FIELDS) == EXPECTED[name]
+
+
+def test_first_matching_selector_wins():
+    fields = [{'field': 'title', 'selectors': ['h2', 'h1'], 'post': 'text'}]
+    assert parse_profile("<h1>first</h1><h2>second</h2>", fields=fields)['title'] == "second"
+
+
+def test_post_processors():
+    html = '<main><p>\n  First line \n Second line</p><a href="/in/someone/">link</a></main>'
+    fields = [
+        {'field': 'text', 'selectors': ['p'], 'post': 'text'},
+        {'field': 'first', 'selectors': ['p'], 'post': 'first_line'},
+        {'field': 'link', 'selectors': ['a'], 'post': 'href'},
+        {'field': 'missing', 'selectors': ['table'], 'post': 'text'},
+    ]
+    assert parse_profile(html, fields=fields) == {
+        'text': "First line Second line", 'first': "First line", 'link': "/in/someone/", 'missing': None, 'profile_url': None,
+    }
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+@pytest.mark.parametrize("parser", ["lxml", "html.parser"])
+def test_benchmark_parse_profile(benchmark, parser, name):
+    """One profile per round, so OPS in the report is profiles parsed per second"""
+    html = fixture(name)
+    benchmark.group = "profiles parsed per second (OPS)"
+    member = benchmark(parse_profile, html, None, PROFILE_FIELDS, parser)
+    assert member['name'] == EXPECTED[name]['name']
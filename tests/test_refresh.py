@@ -0,0 +1,132 @@
+import os
+import time
+import pytest
+from Scraper.BatchRunner import read_members
+from Scraper.GroupsMembersScraper import GroupsMembersScraper
+from Scraper.Refresh import JOINED, LEFT, UPDATED, Refresh, changed, rotating_sample
+from Scraper.RunState import RunState
+from conftest import member, profile_url, urls
+
+
+GROUP = "https://www.linkedin.com/groups/39683/"
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """A scraper whose members list shows scraper.members_list and whose profiles come from scraper.profiles"""
+    scraper = GroupsMembersScraper("member@example.com", "password")
+    scraper.state = RunState(str(tmp_path / "run_state.sqlite3"))
+    scraper.normalizer = None
+    scraper.members_list = []
+    scraper.profiles = {}
+
+    def discover(group_url, search, writer, state, run_key):
+        state.add_discovered(run_key, scraper.members_list)
+        state.mark_discovery_done(run_key)
+
+    def write_members(members_urls, writer, page=None):
+        for member_url in members_urls:
+            if member_url in scraper.profiles:
+                writer.write(scraper.profiles[member_url])
+
+    monkeypatch.setattr(scraper, "ensure_logged_in", lambda: None)
+    monkeypatch.setattr(scraper, "discover_and_enrich", discover)
+    monkeypatch.setattr(scraper, "write_members", write_members)
+    yield scraper
+    scraper.state.close()
+
+
+@pytest.fixture
+def files(tmp_path):
+    return {'master': str(tmp_path / "members.csv"), 'delta': str(tmp_path / "members_delta.csv"),
+            'urls': str(tmp_path / "members_urls.json")}
+
+
+def refresh(scraper, files, members_list, profiles=(), force=False, sample_size=0):
+    scraper.members_list = urls(*members_list)
+    scraper.profiles = {profile['profile_url']: profile for profile in profiles}
+    Refresh(scraper, sample_size=sample_size, min_ratio=0.5).refresh(GROUP, files['urls'], files['master'], files['delta'], force=force)
+
+
+def master(files):
+    return {row['profile_url']: row for row in read_members(files['master'])}
+
+
+def test_rotating_sample_cycles_through_every_member():
+    urls = ["a", "b", "c", "d", "e"]
+    assert rotating_sample(urls, 0, 2) == ["a", "b"]
+    assert rotating_sample(urls, 4, 3) == ["e", "a", "b"]
+    assert rotating_sample(urls, 0, 10) == urls
+    assert rotating_sample([], 3, 2) == []
+    assert rotating_sample(urls, 0, 0) == []
+
+
+def test_changed_ignores_csv_empty_strings():
+    before = {'name': "Member 1", 'headline': "", 'country': "France"}
+    assert not changed(before, {'name': "Member 1", 'headline': None, 'country': "France"})
+    assert changed(before, {'name': "Member 1", 'headline': "Engineer", 'country': "France"})
+
+
+def test_write_never_deletes_the_master(tmp_path):
+    path = str(tmp_path / "members.csv")
+    Refresh.write(None, path, [member(1)], replace=True)
+    Refresh.write(None, path, [], replace=True)
+    assert [row['profile_url'] for row in read_members(path)] == [profile_url(1)]
+
+
+def test_write_removes_a_stale_delta(tmp_path):
+    path = str(tmp_path / "members_delta.csv")
+    Refresh.write(None, path, [dict(member(1), change=JOINED)])
+    Refresh.write(None, path, [])
+    assert not os.path.exists(path)
+
+
+def test_refresh_marks_members_that_left(scraper, files):
+    Refresh.write(None, files['master'], [member(i) for i in range(1, 5)], replace=True)
+    refresh(scraper, files, [1, 2, 3, 5], profiles=[member(5)])
+
+    rows = master(files)
+    assert sorted(rows) == [profile_url(i) for i in range(1, 6)]
+    assert rows[profile_url(4)]['left_at'] == time.strftime('%Y-%m-%d')
+    assert [rows[profile_url(i)]['left_at'] for i in (1, 2, 3, 5)] == [""] * 4
+    delta = {row['profile_url']: row['change'] for row in read_members(files['delta'])}
+    assert delta == {profile_url(5): JOINED, profile_url(4): LEFT}
+
+
+def test_members_who_come_back_are_joined_again(scraper, files):
+    Refresh.write(None, files['master'], [member(1, left_at=None), member(2, left_at="2026-01-01")], replace=True)
+    refresh(scraper, files, [1, 2], profiles=[member(2, headline="Back")])
+
+    rows = master(files)
+    assert (rows[profile_url(2)]['left_at'], rows[profile_url(2)]['headline']) == ("", "Back")
+    assert {row['profile_url']: row['change'] for row in read_members(files['delta'])} == {profile_url(2): JOINED}
+
+
+def test_refresh_reports_sampled_updates(scraper, files):
+    Refresh.write(None, files['master'], [member(1), member(2)], replace=True)
+    refresh(scraper, files, [1, 2], profiles=[member(1, headline="New headline"), member(2)], sample_size=2)
+    assert {row['profile_url']: row['change'] for row in read_members(files['delta'])} == {profile_url(1): UPDATED}
+    assert master(files)[profile_url(1)]['headline'] == "New headline"
+
+
+@pytest.mark.parametrize("members_list", [[], [1]])
+def test_refresh_refuses_a_much_smaller_list(scraper, files, members_list):
+    Refresh.write(None, files['master'], [member(i) for i in range(1, 5)], replace=True)
+    refresh(scraper, files, members_list)
+    assert sorted(master(files)) == [profile_url(i) for i in range(1, 5)]
+    assert all(not row.get('left_at') for row in master(files).values())
+    assert not os.path.exists(files['delta'])
+
+
+def test_forced_refresh_accepts_a_much_smaller_list(scraper, files):
+    Refresh.write(None, files['master'], [member(i) for i in range(1, 5)], replace=True)
+    refresh(scraper, files, [1], force=True)
+    rows = master(files)
+    assert [url for url, row in rows.items() if row['left_at']] == [profile_url(i) for i in range(2, 5)]
+
+
+def test_stayed_members_are_not_enriched_again_by_a_resumed_run(scraper, files):
+    Refresh.write(None, files['master'], [member(1), member(2)], replace=True)
+    refresh(scraper, files, [1, 2, 3])
+    # member-3's fetch failed, it is the only one a resumed scrape still has to enrich
+    assert scraper.state.pending_urls(RunState.run_key(GROUP)) == [profile_url(3)]
@@ -0,0 +1,117 @@
+import json
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from Scraper.GroupsMembersScraper import GroupsMembersScraper
+from Scraper.Retry import (LAYOUT_CHANGED, NAVIGATION, SESSION_EXPIRED, TIMEOUT, DeadLetters, LayoutChanged, RetryPolicy,
+                           SessionExpired, check_session, classify)
+from conftest import profile_url, urls
+
+
+URL = profile_url(1)
+RUN_KEY = "https://www.linkedin.com/groups/39683/|"
+
+
+@pytest.mark.parametrize("error, category", [
+    (SessionExpired("Redirected"), SESSION_EXPIRED),
+    (LayoutChanged("no h1"), LAYOUT_CHANGED),
+    (PlaywrightTimeoutError("Timeout 10000ms exceeded"), TIMEOUT),
+    (PlaywrightError("net::ERR_CONNECTION_RESET at https://www.linkedin.com/in/x/"), NAVIGATION),
+    (PlaywrightError("Navigation failed because page crashed"), NAVIGATION),
+    (ValueError("bad"), "ValueError"),
+])
+def test_classify(error, category):
+    assert classify(error) == category
+
+
+def test_check_session_raises_on_auth_redirects():
+    check_session(URL)
+    with pytest.raises(SessionExpired):
+        check_session("https://www.linkedin.com/authwall?trk=x")
+
+
+def test_retryable_failures_back_off_exponentially():
+    policy = RetryPolicy(max_attempts=4, base_delay=2.0, max_delay=5.0)
+    delays = [policy.decide(PlaywrightTimeoutError("slow"), attempt) for attempt in (1, 2, 3)]
+    assert [category for category, _ in delays] == [TIMEOUT] * 3
+    # base * 2^(attempt-1), capped at max_delay, with +-50% jitter
+    for (_, delay), expected in zip(delays, [2.0, 4.0, 5.0]):
+        assert expected * 0.5 <= delay <= expected * 1.5
+    assert policy.decide(PlaywrightTimeoutError("slow"), 4) == (TIMEOUT, None)
+    assert policy.retries == 3
+
+
+def test_permanent_failures_are_not_retried():
+    policy = RetryPolicy()
+    assert policy.decide(LayoutChanged("no h1"), 1) == (LAYOUT_CHANGED, None)
+    assert policy.decide(SessionExpired("login"), 1) == (SESSION_EXPIRED, None)
+    assert policy.retries == 0
+
+
+def test_retry_budget_is_shared_by_the_run():
+    policy = RetryPolicy(max_attempts=10, budget=2)
+    assert policy.decide(PlaywrightTimeoutError("slow"), 1)[1] is not None
+    assert policy.decide(PlaywrightTimeoutError("slow"), 1)[1] is not None
+    assert policy.decide(PlaywrightTimeoutError("slow"), 1) == (TIMEOUT, None)
+
+
+@pytest.fixture
+def dead_letters(tmp_path):
+    return DeadLetters(str(tmp_path / "dead_letters.jsonl"))
+
+
+def write_entries(dead_letters, *entries):
+    with open(dead_letters.path, 'w', encoding='utf-8') as f:
+        for url, ts in entries:
+            f.write(json.dumps({'url': url, 'run_key': RUN_KEY, 'category': TIMEOUT, 'error': "", 'attempts': 3, 'ts': ts}) + '\n')
+
+
+def test_load_keeps_the_latest_entry_per_url(dead_letters):
+    assert dead_letters.load() == []
+    dead_letters.add(URL, TIMEOUT, PlaywrightTimeoutError("slow"), 3, RUN_KEY)
+    dead_letters.add(URL, LAYOUT_CHANGED, LayoutChanged("no h1"), 1, RUN_KEY)
+    [entry] = dead_letters.load()
+    assert (entry['url'], entry['category'], entry['run_key']) == (URL, LAYOUT_CHANGED, RUN_KEY)
+    assert dead_letters.count == 2
+
+
+def test_remove_before_drops_every_replayed_entry(dead_letters):
+    write_entries(dead_letters, ("a", 1.0), ("b", 2.0), ("b", 5.0))
+    dead_letters.remove_before(3.0)
+    assert [(entry['url'], entry['ts']) for entry in dead_letters.load()] == [("b", 5.0)]
+
+
+def test_remove_before_keeps_entries_the_replay_never_reached(dead_letters):
+    # a was recovered, b failed again during the replay, c was never retried (the session expired first)
+    write_entries(dead_letters, ("a", 1.0), ("b", 1.0), ("c", 1.0), ("b", 5.0))
+    dead_letters.remove_before(3.0, replayed={"a"})
+    with open(dead_letters.path, encoding='utf-8') as f:
+        assert [(entry['url'], entry['ts']) for entry in map(json.loads, f)] == [("c", 1.0), ("b", 5.0)]
+
+
+def test_failures_during_replay_keep_their_original_run_key(tmp_path):
+    scraper = GroupsMembersScraper("member@example.com", "password")
+    scraper.dead_letters = DeadLetters(str(tmp_path / "dead_letters.jsonl"))
+    scraper.run_key = "https://www.linkedin.com/groups/1/|stale"
+    scraper.replay_run_keys = {URL: RUN_KEY}
+    scraper.dead_letter(URL, TIMEOUT, PlaywrightTimeoutError("slow"), 3)
+    assert scraper.dead_letters.load()[0]['run_key'] == RUN_KEY
+
+
+def test_sync_run_stops_once_the_renewed_session_expires_too(tmp_path, monkeypatch):
+    scraper = GroupsMembersScraper("member@example.com", "password")
+    scraper.dead_letters = DeadLetters(str(tmp_path / "dead_letters.jsonl"))
+    fetched = []
+
+    def fetch_member(page, member_url):
+        fetched.append(member_url)
+        raise SessionExpired("Redirected to https://www.linkedin.com/authwall")
+
+    monkeypatch.setattr(scraper, "fetch_member", fetch_member)
+    monkeypatch.setattr(scraper, "login", lambda: None)
+    with pytest.raises(SessionExpired):
+        list(scraper.get_members_infos(urls(1, 2, 3), page=object()))
+    # One re-login, then the run stops instead of walking every remaining profile into the authwall
+    assert fetched == urls(1, 1)
+    assert scraper.session_renewals == 1
+    assert scraper.dead_letters.count == 0
@@ -0,0 +1,74 @@
+import pytest
+from Scraper.RunState import RunState
+from conftest import urls
+
+
+GROUP = "https://www.linkedin.com/groups/39683/"
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = RunState(str(tmp_path / "run_state.sqlite3"))
+    yield state
+    state.close()
+
+
+def test_run_key_ignores_trailing_slash(state):
+    assert RunState.run_key(GROUP) == RunState.run_key(GROUP.rstrip('/'))
+    assert RunState.run_key(GROUP, "a") != RunState.run_key(GROUP)
+
+
+def test_add_discovered_returns_urls_still_to_enrich(state):
+    key = state.start(GROUP)
+    assert state.add_discovered(key, urls(1, 2, 3)) == urls(1, 2, 3)
+    state.mark_enriched(key, urls(2))
+    # Seen again on a later scroll: only the ones not enriched yet come back
+    assert state.add_discovered(key, urls(2, 3, 4)) == urls(3, 4)
+    assert state.discovered_urls(key) == urls(1, 2, 3, 4)
+    assert state.pending_urls(key) == urls(1, 3, 4)
+
+
+def test_resume_keeps_progress(tmp_path):
+    path = str(tmp_path / "run_state.sqlite3")
+    state = RunState(path)
+    key = state.start(GROUP, "shakira")
+    state.add_discovered(key, urls(1, 2, 3))
+    state.mark_discovery_done(key)
+    state.mark_enriched(key, urls(1))
+    state.close()
+
+    # A new process picks the journal up where the last one stopped
+    state = RunState(path)
+    assert state.start(GROUP, "shakira", resume=True) == key
+    assert state.is_discovery_done(key)
+    assert state.pending_urls(key) == urls(2, 3)
+    state.close()
+
+
+def test_start_without_resume_wipes_progress(state):
+    key = state.start(GROUP)
+    state.add_discovered(key, urls(1, 2))
+    state.mark_discovery_done(key)
+    state.mark_enriched(key, urls(1))
+
+    assert state.start(GROUP) == key
+    assert not state.is_discovery_done(key)
+    assert state.discovered_urls(key) == []
+
+
+def test_runs_are_isolated_by_search(state):
+    first = state.start(GROUP, "a")
+    second = state.start(GROUP, "b")
+    state.add_discovered(first, urls(1))
+    state.add_discovered(second, urls(2))
+    state.start(GROUP, "a")
+    assert state.discovered_urls(first) == []
+    assert state.discovered_urls(second) == urls(2)
+
+
+def test_refresh_cursor_survives_a_new_run(state):
+    key = state.start(GROUP)
+    assert state.refresh_cursor(key) == 0
+    state.set_refresh_cursor(key, 7)
+    state.start(GROUP)
+    assert state.refresh_cursor(key) == 7
@@ -0,0 +1,35 @@
+import pytest
+from utils.urls import canonical_profile_url
+
+
+CANONICAL = "https://www.linkedin.com/in/amina-el-idrissi/"
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.linkedin.com/in/amina-el-idrissi/",
+    "https://www.linkedin.com/in/amina-el-idrissi",
+    "https://www.linkedin.com/in/Amina-El-Idrissi/",
+    "https://fr.linkedin.com/in/amina-el-idrissi/",
+    "https://linkedin.com/in/amina-el-idrissi/",
+    "http://www.linkedin.com/in/amina-el-idrissi/?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3AACoAAB",
+    "https://www.linkedin.com/in/amina-el-idrissi/details/experience/#top",
+    "  https://www.linkedin.com/in/amina%2Del%2Didrissi/  ",
+])
+def test_profile_variants_share_one_url(url):
+    assert canonical_profile_url(url) == CANONICAL
+
+
+def test_member_ids_keep_their_case():
+    url = "https://www.linkedin.com/in/ACoAABcdEfGhIjKlMnOpQrStUvWxYz/?lipi=x"
+    assert canonical_profile_url(url) == "https://www.linkedin.com/in/ACoAABcdEfGhIjKlMnOpQrStUvWxYz/"
+
+
+def test_non_ascii_slugs_are_percent_encoded_once():
+    assert canonical_profile_url("https://www.linkedin.com/in/jos%C3%A9-garc%C3%ADa/") == \
+        canonical_profile_url("https://www.linkedin.com/in/José-García/") == \
+        "https://www.linkedin.com/in/jos%C3%A9-garc%C3%ADa/"
+
+
+def test_other_urls_only_lose_query_and_fragment():
+    assert canonical_profile_url("https://www.linkedin.com/company/acme?trk=x#about") == "https://www.linkedin.com/company/acme/"
+    assert canonical_profile_url("https://example.com/in/someone/?a=1") == "https://example.com/in/someone/"
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from Scraper.Waits import AdaptiveWaiter, AsyncAdaptiveWaiter, LatencyStats, PlaywrightTimeoutError
+
+
+class FakePage:
+    """Finds the selectors in `present`, times out on the rest and records the politeness delays"""
+
+    def __init__(self, present=()):
+        self.present = set(present)
+        self.delays = []
+
+    def wait(self, target, timeout):
+        if target not in self.present:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    def wait_for_selector(self, selector, state, timeout):
+        self.wait(selector, timeout)
+
+    def wait_for_function(self, expression, arg, timeout):
+        self.wait(expression, timeout)
+
+    def wait_for_timeout(self, ms):
+        self.delays.append(ms)
+
+
+class AsyncFakePage(FakePage):
+    async def wait_for_selector(self, selector, state, timeout):
+        self.wait(selector, timeout)
+
+    async def wait_for_function(self, expression, arg, timeout):
+        self.wait(expression, timeout)
+
+
+def stats_with(step, *samples):
+    stats = LatencyStats()
+    for sample in samples:
+        stats.record(step, sample)
+    return stats
+
+
+def test_percentile_is_nearest_rank():
+    assert stats_with("profile", 1000, 10).percentile("profile", 50) == 10
+    stats = stats_with("profile", *range(100, 0, -1))
+    assert [stats.percentile("profile", pct) for pct in (1, 50, 95, 99, 100)] == [1, 50, 95, 99, 100]
+    assert stats_with("profile", 42).percentile("profile", 99) == 42
+
+
+def test_percentile_of_an_unknown_step_is_zero():
+    assert LatencyStats().percentile("profile", 95) == 0.0
+
+
+def test_histogram_buckets_are_upper_bounds():
+    histogram = stats_with("profile", 50, 100, 101, 9999, 10001).histogram("profile")
+    assert histogram["<=100ms"] == 2
+    assert histogram["<=250ms"] == 1
+    assert histogram["<=10000ms"] == 1
+    assert histogram[">10000ms"] == 1
+    assert sum(histogram.values()) == 5
+
+
+def test_summary_lists_percentiles_and_used_buckets():
+    summary = stats_with("profile", 10, 1000).summary()
+    assert "profile: n=2 total=1.0s mean=505ms p50=10ms p95=1000ms p99=1000ms max=1000ms" in summary
+    assert "<=100ms:1 <=1000ms:1" in summary
+    assert "<=250ms" not in summary
+
+
+def test_waiter_reports_found_and_timed_out_selectors():
+    waiter = AdaptiveWaiter(timeout_ms=100, min_delay_ms=0)
+    page = FakePage(present={"main"})
+    assert waiter.wait_for_selector(page, "profile", "main")
+    assert not waiter.wait_for_selector(page, "profile", "#missing")
+    assert not waiter.wait_for_function(page, "scroll", "() => false")
+    assert len(waiter.stats.samples["profile"]) == 2
+    assert len(waiter.stats.samples["scroll"]) == 1
+    assert page.delays == []
+
+
+def test_waiter_keeps_the_politeness_delay_when_the_page_is_fast():
+    waiter = AdaptiveWaiter(min_delay_ms=200)
+    page = FakePage(present={"main"})
+    waiter.wait_for_selector(page, "profile", "main")
+    waiter.pause(page, "between_profiles")
+    assert len(page.delays) == 2
+    # The delay is jittered up to 1.5x and only tops up the time already spent waiting
+    assert all(150 < delay <= 300 for delay in page.delays)
+    assert waiter.stats.percentile("profile", 100) < 50
+
+
+def test_async_waiter_shares_the_sync_behaviour():
+    waiter = AsyncAdaptiveWaiter(timeout_ms=100, min_delay_ms=0)
+    page = AsyncFakePage(present={"main"})
+
+    async def wait():
+        return [await waiter.wait_for_selector(page, "profile", "main"),
+                await waiter.wait_for_function(page, "profile", "() => false")]
+
+    assert asyncio.run(wait()) == [True, False]
+    assert len(waiter.stats.samples["profile"]) == 2
+
+
+def test_async_waiter_sleeps_the_politeness_delay():
+    start = time.perf_counter()
+    asyncio.run(AsyncAdaptiveWaiter(min_delay_ms=20).pause(AsyncFakePage(), "between_profiles"))
+    assert time.perf_counter() - start >= 0.018
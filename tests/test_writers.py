@@ -0,0 +1,153 @@
+import csv
+import json
+import pytest
+from Scraper.Writers import CsvWriter, JsonArrayWriter, JsonLinesWriter, open_writers
+from conftest import member
+
+
+def crash(writer):
+    """Flush what is buffered, then drop the file without finalize() as a killed run would"""
+    writer.flush()
+    writer.file.close()
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_json_array_is_valid_after_close(tmp_path):
+    path = str(tmp_path / "members.json")
+    with JsonArrayWriter(path, batch_size=2) as writer:
+        for i in range(5):
+            writer.write(member(i))
+    assert read_json(path) == [member(i) for i in range(5)]
+
+
+def test_json_array_without_records_is_an_empty_array(tmp_path):
+    path = str(tmp_path / "members.json")
+    writer = JsonArrayWriter(path)
+    writer.open()
+    writer.close()
+    assert read_json(path) == []
+
+
+def test_json_array_resumes_after_crash(tmp_path):
+    path = str(tmp_path / "members.json")
+    writer = JsonArrayWriter(path, batch_size=2)
+    for i in range(3):
+        writer.write(member(i))
+    crash(writer)
+    with open(path, encoding='utf-8') as f:
+        assert not f.read().rstrip().endswith(']')
+
+    with JsonArrayWriter(path, append=True) as writer:
+        for i in range(3, 5):
+            writer.write(member(i))
+    assert read_json(path) == [member(i) for i in range(5)]
+
+
+def test_json_array_resumes_after_clean_close(tmp_path):
+    path = str(tmp_path / "members.json")
+    with JsonArrayWriter(path) as writer:
+        writer.write(member(0))
+    with JsonArrayWriter(path, append=True) as writer:
+        writer.write(member(1))
+    assert read_json(path) == [member(0), member(1)]
+
+
+def test_json_array_resumes_an_empty_array(tmp_path):
+    path = str(tmp_path / "members.json")
+    (tmp_path / "members.json").write_text("[]", encoding='utf-8')
+    with JsonArrayWriter(path, append=True) as writer:
+        writer.write(member(0))
+    assert read_json(path) == [member(0)]
+
+
+def test_json_array_drops_only_a_torn_last_item(tmp_path):
+    path = str(tmp_path / "members.json")
+    writer = JsonArrayWriter(path, batch_size=3)
+    for i in range(3):
+        writer.write(member(i))
+    crash(writer)
+    # Killed halfway through the next batch, inside a multi-byte character
+    with open(path, 'ab') as f:
+        f.write(',\n    {\n        "name": "Member 3",\n        "country": "Paris, \u00ce'.encode('utf-8')[:-1])
+
+    with JsonArrayWriter(path, append=True) as writer:
+        writer.write(member(3))
+    assert read_json(path) == [member(i) for i in range(4)]
+
+
+def test_json_array_restarts_when_the_first_item_was_torn(tmp_path):
+    path = str(tmp_path / "members.json")
+    (tmp_path / "members.json").write_text('[\n    {"name": "Mem', encoding='utf-8')
+    with JsonArrayWriter(path, append=True) as writer:
+        writer.write(member(0))
+    assert read_json(path) == [member(0)]
+
+
+def test_json_array_refuses_to_resume_a_foreign_file(tmp_path):
+    path = str(tmp_path / "members.json")
+    (tmp_path / "members.json").write_text('{"members": [{"name": "Member 0"}', encoding='utf-8')
+    writer = JsonArrayWriter(path, append=True, batch_size=1)
+    with pytest.raises(ValueError):
+        writer.write(member(1))
+    assert (tmp_path / "members.json").read_text(encoding='utf-8') == '{"members": [{"name": "Member 0"}'
+
+
+def test_json_array_without_append_overwrites(tmp_path):
+    path = str(tmp_path / "members.json")
+    with JsonArrayWriter(path) as writer:
+        writer.write(member(0))
+    with JsonArrayWriter(path) as writer:
+        writer.write(member(1))
+    assert read_json(path) == [member(1)]
+
+
+def test_csv_resumes_with_the_existing_header(tmp_path):
+    path = str(tmp_path / "members.csv")
+    writer = CsvWriter(path, batch_size=1)
+    writer.write(member(0))
+    crash(writer)
+
+    # Columns come from the file, in its order, even if the new records list them differently
+    reordered = {key: value for key, value in reversed(list(member(1).items()))}
+    with CsvWriter(path, append=True) as writer:
+        writer.write(dict(reordered, extra="ignored"))
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(member(0).keys())
+    assert [dict(zip(rows[0], row)) for row in rows[1:]] == [member(0), member(1)]
+
+
+def test_json_lines_resume_appends(tmp_path):
+    path = str(tmp_path / "members.jsonl")
+    writer = JsonLinesWriter(path, batch_size=1)
+    writer.write(member(0))
+    crash(writer)
+    with JsonLinesWriter(path, append=True) as writer:
+        writer.write(member(1))
+    with open(path, encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == [member(0), member(1)]
+
+
+def test_on_flush_only_reports_records_on_disk(tmp_path):
+    flushed = []
+    with open_writers(str(tmp_path / "members.csv"), ['csv', 'json'], on_flush=flushed.extend, batch_size=2) as writer:
+        writer.write(member(0))
+        assert flushed == []
+        writer.write(member(1))
+        assert flushed == [member(0), member(1)]
+        writer.write(member(2))
+    assert flushed == [member(i) for i in range(3)]
+    assert read_json(str(tmp_path / "members.json")) == [member(i) for i in range(3)]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    try:
+        open_writers(str(tmp_path / "members.csv"), ['xml'])
+    except ValueError as e:
+        assert 'xml' in str(e)
+    else:
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,104 @@
+import re
+import unicodedata
+from typing import Dict, Optional
+
+
+# Offline gazetteer: ISO 3166-1 alpha-2 code -> country names as LinkedIn displays them
+# in its English, French, German, Spanish, Portuguese, Italian and Dutch interfaces.
+COUNTRY_NAMES: Dict[str, list] = {
+    'US': ['United States', 'United States of America', 'USA', 'États-Unis', 'Vereinigte Staaten', 'Estados Unidos', 'Stati Uniti', 'Verenigde Staten'],
+    'GB': ['United Kingdom', 'UK', 'Great Britain', 'Royaume-Uni', 'Vereinigtes Königreich', 'Reino Unido', 'Regno Unito', 'Verenigd Koninkrijk'],
+    'CA': ['Canada', 'Kanada', 'Canadá'],
+    'MX': ['Mexico', 'Mexique', 'Mexiko', 'México', 'Messico'],
+    'BR': ['Brazil', 'Brésil', 'Brasilien', 'Brasil', 'Brasile', 'Brazilië'],
+    'AR': ['Argentina', 'Argentine', 'Argentinien', 'Argentinië'],
+    'CL': ['Chile', 'Chili'],
+    'CO': ['Colombia', 'Colombie', 'Kolumbien', 'Colômbia'],
+    'PE': ['Peru', 'Pérou', 'Perú'],
+    'FR': ['France', 'Frankreich', 'Francia', 'França', 'Frankrijk'],
+    'DE': ['Germany', 'Allemagne', 'Deutschland', 'Alemania', 'Alemanha', 'Germania', 'Duitsland'],
+    'ES': ['Spain', 'Espagne', 'Spanien', 'España', 'Espanha', 'Spagna', 'Spanje'],
+    'PT': ['Portugal', 'Portogallo'],
+    'IT': ['Italy', 'Italie', 'Italien', 'Italia', 'Itália', 'Italië'],
+    'NL': ['Netherlands', 'The Netherlands', 'Pays-Bas', 'Niederlande', 'Países Bajos', 'Países Baixos', 'Paesi Bassi', 'Nederland'],
+    'BE': ['Belgium', 'Belgique', 'Belgien', 'Bélgica', 'Belgio', 'België'],
+    'CH': ['Switzerland', 'Suisse', 'Schweiz', 'Suiza', 'Suíça', 'Svizzera', 'Zwitserland'],
+    'AT': ['Austria', 'Autriche', 'Österreich', 'Áustria', 'Oostenrijk'],
+    'IE': ['Ireland', 'Irlande', 'Irland', 'Irlanda', 'Ierland'],
+    'LU': ['Luxembourg', 'Luxemburg', 'Luxemburgo', 'Lussemburgo'],
+    'SE': ['Sweden', 'Suède', 'Schweden', 'Suecia', 'Suécia', 'Svezia', 'Zweden'],
+    'NO': ['Norway', 'Norvège', 'Norwegen', 'Noruega', 'Norvegia', 'Noorwegen'],
+    'DK': ['Denmark', 'Danemark', 'Dänemark', 'Dinamarca', 'Danimarca', 'Denemarken'],
+    'FI': ['Finland', 'Finlande', 'Finnland', 'Finlandia', 'Finlândia'],
+    'PL': ['Poland', 'Pologne', 'Polen', 'Polonia', 'Polônia'],
+    'CZ': ['Czechia', 'Czech Republic', 'Tchéquie', 'République tchèque', 'Tschechien', 'Chequia', 'República Checa', 'Repubblica Ceca', 'Tsjechië'],
+    'HU': ['Hungary', 'Hongrie', 'Ungarn', 'Hungría', 'Hungria', 'Ungheria', 'Hongarije'],
+    'RO': ['Romania', 'Roumanie', 'Rumänien', 'Rumania', 'Roménia', 'Roemenië'],
+    'GR': ['Greece', 'Grèce', 'Griechenland', 'Grecia', 'Grécia', 'Griekenland'],
+    'TR': ['Turkey', 'Türkiye', 'Turquie', 'Türkei', 'Turquía', 'Turquia', 'Turchia', 'Turkije'],
+    'UA': ['Ukraine', 'Ucrania', 'Ucrânia', 'Ucraina', 'Oekraïne'],
+    'RU': ['Russia', 'Russian Federation', 'Russie', 'Russland', 'Rusia', 'Rússia', 'Rusland'],
+    'MA': ['Morocco', 'Maroc', 'Marokko', 'Marruecos', 'Marrocos', 'Marocco'],
+    'DZ': ['Algeria', 'Algérie', 'Algerien', 'Argelia', 'Argélia', 'Algerije'],
+    'TN': ['Tunisia', 'Tunisie', 'Tunesien', 'Túnez', 'Tunísia', 'Tunesië'],
+    'EG': ['Egypt', 'Égypte', 'Ägypten', 'Egipto', 'Egito', 'Egitto'],
+    'NG': ['Nigeria', 'Nigéria'],
+    'KE': ['Kenya', 'Kenia', 'Quénia', 'Quênia'],
+    'GH': ['Ghana', 'Gana'],
+    'SN': ['Senegal', 'Sénégal'],
+    'CI': ["Côte d'Ivoire", 'Ivory Coast', 'Elfenbeinküste', 'Costa de Marfil', 'Costa do Marfim', "Costa d'Avorio", 'Ivoorkust'],
+    'CM': ['Cameroon', 'Cameroun', 'Kamerun', 'Camerún', 'Camarões', 'Camerun', 'Kameroen'],
+    'ZA': ['South Africa', 'Afrique du Sud', 'Südafrika', 'Sudáfrica', 'África do Sul', 'Sudafrica', 'Zuid-Afrika'],
+    'AE': ['United Arab Emirates', 'UAE', 'Émirats arabes unis', 'Vereinigte Arabische Emirate', 'Emiratos Árabes Unidos', 'Emirados Árabes Unidos', 'Emirati Arabi Uniti', 'Verenigde Arabische Emiraten'],
+    'SA': ['Saudi Arabia', 'Arabie saoudite', 'Saudi-Arabien', 'Arabia Saudita', 'Arábia Saudita', 'Saoedi-Arabië'],
+    'QA': ['Qatar', 'Katar', 'Catar'],
+    'IL': ['Israel', 'Israël', 'Israele'],
+    'LB': ['Lebanon', 'Liban', 'Libanon', 'Líbano', 'Libano'],
+    'JO': ['Jordan', 'Jordanie', 'Jordanien', 'Jordania', 'Jordânia', 'Giordania', 'Jordanië'],
+    'IN': ['India', 'Inde', 'Indien', 'Índia'],
+    'PK': ['Pakistan', 'Paquistán', 'Paquistão'],
+    'BD': ['Bangladesh', 'Bangladesch'],
+    'CN': ['China', 'Chine', 'Cina'],
+    'HK': ['Hong Kong', 'Hong Kong SAR', 'Hongkong'],
+    'JP': ['Japan', 'Japon', 'Japón', 'Japão', 'Giappone'],
+    'KR': ['South Korea', 'Republic of Korea', 'Corée du Sud', 'Südkorea', 'Corea del Sur', 'Coreia do Sul', 'Corea del Sud', 'Zuid-Korea'],
+    'SG': ['Singapore', 'Singapour', 'Singapur', 'Singapura'],
+    'MY': ['Malaysia', 'Malaisie', 'Malasia', 'Malásia', 'Maleisië'],
+    'ID': ['Indonesia', 'Indonésie', 'Indonesien', 'Indonésia', 'Indonesië'],
+    'PH': ['Philippines', 'Philippinen', 'Filipinas', 'Filippine', 'Filipijnen'],
+    'TH': ['Thailand', 'Thaïlande', 'Tailandia', 'Tailândia', 'Thailandia'],
+    'VN': ['Vietnam', 'Viêt Nam', 'Viet Nam', 'Vietnã'],
+    'AU': ['Australia', 'Australie', 'Australien', 'Austrália', 'Australië'],
+    'NZ': ['New Zealand', 'Nouvelle-Zélande', 'Neuseeland', 'Nueva Zelanda', 'Nova Zelândia', 'Nuova Zelanda', 'Nieuw-Zeeland'],
+}
+
+SEPARATORS_RE = re.compile(r"[\s\-'’.]+")
+
+
+def fold(text: str) -> str:
+    """Lookup key: accents, case, hyphens and apostrophes do not matter ("États-Unis" == "etats unis")"""
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return SEPARATORS_RE.sub(' ', text.casefold()).strip()
+
+
+COUNTRY_CODES: Dict[str, str] = {fold(name): code for code, names in COUNTRY_NAMES.items() for name in names}
+
+
+def country_code(name: str) -> Optional[str]:
+    return COUNTRY_CODES.get(fold(name))
+
+
+def parse_location(location: Optional[str]) -> Dict[str, Optional[str]]:
+    """Split a LinkedIn location into city, region and ISO country code.
+
+    LinkedIn shows "City, Region, Country", "Region, Country", a bare country or a metro area
+    ("Greater Paris Metropolitan Region"); anything that is not a known country stays as text.
+    """
+    parts = [part.strip() for part in (location or '').split(',') if part.strip()]
+    code = country_code(parts[-1]) if parts else None
+    if code:
+        parts = parts[:-1]
+    city = parts[0] if len(parts) >= 2 else None
+    region = parts[-1] if parts else None
+    return {'city': city, 'region': region, 'country_code': code}
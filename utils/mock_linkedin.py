@@ -0,0 +1,218 @@
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+
+LOCATIONS = [
+    "Manille, Région Capitale Nationale, Philippines",
+    "College Station, Texas, États-Unis",
+    "Paris, Île-de-France, France",
+    "Casablanca, Casablanca-Settat, Maroc",
+    "London, England, United Kingdom",
+    "Berlin, Berlin, Allemagne",
+    "Toronto, Ontario, Canada",
+    "Lagos, Lagos State, Nigeria",
+]
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title></head>
+<body><main>{body}</main></body></html>"""
+
+LOGIN_BODY = """
+<h1>Sign in</h1>
+<form method="post" action="/login">
+    <input name="session_key" type="text">
+    <input name="session_password" type="password">
+    <button type="submit">Sign in</button>
+</form>"""
+
+MEMBER_LINK = '<li><a class="ember-view ui-conditional-link-wrapper ui-entity-action-row__link" href="/in/{slug}/">{name}</a></li>'
+
+MEMBERS_BODY = """
+<h1>Members</h1>
+<input placeholder="Search members" type="text">
+<ul class="artdeco-list groups-members-list__results-list">{items}</ul>
+{more}
+<script>
+    const list = document.querySelector('ul.groups-members-list__results-list');
+    const input = document.querySelector('input[placeholder="Search members"]');
+    let offset = {offset};
+    let query = '';
+
+    function setMoreButton(visible) {{
+        let button = document.querySelector('#show-more');
+        if (visible && !button) {{
+            button = document.createElement('button');
+            button.id = 'show-more';
+            button.textContent = 'Show more results';
+            list.after(button);
+        }} else if (!visible && button) {{
+            button.remove();
+        }}
+    }}
+
+    async function load(reset) {{
+        const response = await fetch(`page?offset=${{offset}}&q=${{encodeURIComponent(query)}}`);
+        const data = await response.json();
+        if (reset) list.innerHTML = '';
+        for (const member of data.members) {{
+            const li = document.createElement('li');
+            li.innerHTML = `<a class="ember-view ui-conditional-link-wrapper ui-entity-action-row__link" href="/in/${{member.slug}}/">${{member.name}}</a>`;
+            list.appendChild(li);
+        }}
+        offset += data.members.length;
+        setMoreButton(data.more);
+    }}
+
+    document.addEventListener('click', event => {{
+        if (event.target.id === 'show-more') load(false);
+    }});
+    input.addEventListener('keydown', event => {{
+        if (event.key === 'Enter') {{
+            query = input.value;
+            offset = 0;
+            load(true);
+        }}
+    }});
+</script>"""
+
+PROFILE_BODY = """
+<section>
+    <img src="/static/avatar/{index}.png" alt="">
+    <h1 class="inline t-24 v-align-middle break-words">{name}</h1>
+    <div class="text-body-medium break-words">{headline}</div>
+    <span class="text-body-small inline t-black--light break-words">{location}</span>
+</section>
+<section><p>{filler}</p></section>"""
+
+
+class MockLinkedInServer:
+    """Local stand-in for the pages the scraper visits: login, group, paginated members list and N profiles"""
+
+    def __init__(self, members: int = 100, latency_ms: float = 0, page_size: int = 50, profile_kb: int = 50, port: int = 0):
+        self.members = [self.member(i) for i in range(members)]
+        self.latency_ms = latency_ms
+        self.page_size = page_size
+        self.filler = ("lorem ipsum " * (profile_kb * 1024 // 12 + 1))[:profile_kb * 1024]
+        self.port = port
+        self.server = None
+        self.requests = 0
+
+    @staticmethod
+    def member(i: int) -> Dict:
+        return {
+            'slug': f"member-{i}",
+            'name': f"Member {i}",
+            'headline': f"Engineer at Company {i % 97}",
+            'location': LOCATIONS[i % len(LOCATIONS)],
+        }
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def matching(self, query: str) -> List[Dict]:
+        query = query.lower()
+        return [member for member in self.members if query in member['name'].lower()] if query else self.members
+
+    def start(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                mock.handle(self, 'GET')
+
+            def do_POST(self):
+                mock.handle(self, 'POST')
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def send(self, handler, status: int, body: bytes = b'', content_type: str = 'text/html; charset=utf-8', headers: Dict = None):
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def page(self, handler, title: str, body: str):
+        self.send(handler, 200, PAGE.format(title=html.escape(title), body=body).encode('utf-8'))
+
+    def handle(self, handler, method: str):
+        self.requests += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        url = urlsplit(handler.path)
+        path = url.path
+        logged_in = 'li_at=' in handler.headers.get('Cookie', '')
+
+        if path == '/login' and method == 'POST':
+            handler.rfile.read(int(handler.headers.get('Content-Length', 0)))
+            return self.send(handler, 302, headers={'Location': '/feed/', 'Set-Cookie': 'li_at=mock-session; Path=/; Max-Age=86400'})
+        if path in ('/login', '/authwall'):
+            return self.page(handler, 'Sign in', LOGIN_BODY)
+        if not logged_in and not path.startswith('/static/'):
+            return self.send(handler, 302, headers={'Location': '/authwall'})
+        if path == '/feed/':
+            return self.page(handler, 'Feed', '<h1>Feed</h1>')
+        if path.startswith('/static/avatar/'):
+            return self.send(handler, 200, b'\x89PNG' + b'\x00' * 4096, 'image/png')
+
+        parts = [part for part in path.split('/') if part]
+        if len(parts) == 2 and parts[0] == 'groups':
+            return self.page(handler, 'Group', f'<h1>Group {html.escape(parts[1])}</h1>')
+        if len(parts) == 3 and parts[0] == 'groups' and parts[2] == 'members':
+            first = self.members[:self.page_size]
+            items = ''.join(MEMBER_LINK.format(slug=m['slug'], name=html.escape(m['name'])) for m in first)
+            more = '<button id="show-more">Show more results</button>' if len(self.members) > len(first) else ''
+            return self.page(handler, 'Members', MEMBERS_BODY.format(items=items, more=more, offset=len(first)))
+        if len(parts) == 4 and parts[0] == 'groups' and parts[2] == 'members' and parts[3] == 'page':
+            params = parse_qs(url.query)
+            offset = int(params.get('offset', ['0'])[0])
+            matching = self.matching(params.get('q', [''])[0])
+            chunk = matching[offset:offset + self.page_size]
+            body = json.dumps({
+                'members': [{'slug': m['slug'], 'name': m['name']} for m in chunk],
+                'more': offset + len(chunk) < len(matching),
+            }).encode('utf-8')
+            return self.send(handler, 200, body, 'application/json')
+        if len(parts) == 2 and parts[0] == 'in' and parts[1].startswith('member-'):
+            index = int(parts[1].split('-', 1)[1])
+            if index < len(self.members):
+                member = self.members[index]
+                return self.page(handler, member['name'], PROFILE_BODY.format(
+                    index=index,
+                    name=html.escape(member['name']),
+                    headline=html.escape(member['headline']),
+                    location=html.escape(member['location']),
+                    filler=self.filler,
+                ))
+        self.send(handler, 404, b'Not found')
+
+
+if __name__ == "__main__":
+    import sys
+    server = MockLinkedInServer(members=int(sys.argv[1]) if len(sys.argv) > 1 else 100, port=8765).start()
+    print(f"Mock LinkedIn serving {len(server.members)} members on {server.base_url} (group: {server.base_url}groups/1/)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
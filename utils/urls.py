@@ -0,0 +1,26 @@
+import re
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+
+PROFILE_PATH_RE = re.compile(r'^/in/([^/]+)')
+
+
+def canonical_profile_url(url: str) -> str:
+    """Map every variant of a member profile URL to https://www.linkedin.com/in/<slug>/
+
+    Query strings, fragments, country/mobile subdomains, sub-pages (/details/...) and
+    percent-encoding differences are dropped. Vanity slugs are case-insensitive, but
+    opaque member ids (ACoAA...) are not, so those keep their case.
+    URLs that are not /in/ profiles only lose their query string and fragment.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    match = PROFILE_PATH_RE.match(parts.path)
+    if not match or not (host == 'linkedin.com' or host.endswith('.linkedin.com')):
+        path = parts.path if parts.path.endswith('/') else parts.path + '/'
+        return urlunsplit((parts.scheme or 'https', host, path, '', ''))
+
+    slug = unquote(match.group(1))
+    if not slug.startswith('ACoA'):
+        slug = slug.lower()
+    return f"https://www.linkedin.com/in/{quote(slug, safe='-_.~')}/"